@@ -1,16 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
 import logging
 
-# Use relative imports if running as a module
-try:
-    from ...models.database import get_postgres_connection
-    from ...models.schemas import ChatbotRequest, ChatbotResponse
-    from ...services.chatbot import PermChatbot
-except ImportError:
-    # Use absolute imports if running as a script
-    from src.dol_analytics.models.database import get_postgres_connection
-    from src.dol_analytics.models.schemas import ChatbotRequest, ChatbotResponse
-    from src.dol_analytics.services.chatbot import PermChatbot
+from ...models.database import get_postgres_connection
+from ...models.schemas import ChatbotRequest, ChatbotResponse
+from ...services.chatbot import PermChatbot
 
 # Set up logging
 logger = logging.getLogger("dol_analytics.chatbot")
@@ -47,8 +41,8 @@ async def chatbot_endpoint(
         # Initialize chatbot with database connection
         chatbot = PermChatbot(conn)
         
-        # Process the message
-        response = chatbot.process_message(request.message)
+        # Process the message (its queries block, so off the event loop)
+        response = await run_in_threadpool(chatbot.process_message, request.message)
         
         return ChatbotResponse(**response)
         
@@ -1,53 +1,89 @@
-from datetime import date, timedelta, datetime
-from typing import Dict, Any, Optional, List
-from fastapi import APIRouter, Depends, Query, HTTPException, Request
+import asyncio
+import base64
+import hashlib
+import logging
+from datetime import date, timedelta
+from typing import Dict, Any, Optional, List, Literal
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 import psycopg2
 import psycopg2.extras
 
-# Use relative imports if running as a module
-try:
-    from ...models.database import get_postgres_connection
-    from ...models.schemas import (
-        DailyVolumeData, WeeklyAverageData, WeeklyVolumeData, MonthlyVolumeData, 
-        TodaysProgressData, MonthlyBacklogData, PermCaseActivityData, PermCasesMetrics,
-        CompanySearchRequest, CompanySearchResponse, CompanyCasesRequest, CompanyCasesResponse,
-        UpdatedCasesRequest, UpdatedCasesResponse
-    )
-    from ..routes.predictions import verify_recaptcha
-    from ...middleware.rate_limiter import check_rate_limit, rate_limiter
-except ImportError:
-    # Use absolute imports if running as a script
-    from src.dol_analytics.models.database import get_postgres_connection
-    from src.dol_analytics.models.schemas import (
-        DailyVolumeData, WeeklyAverageData, WeeklyVolumeData, MonthlyVolumeData, 
-        TodaysProgressData, MonthlyBacklogData, PermCaseActivityData, PermCasesMetrics,
-        CompanySearchRequest, CompanySearchResponse, CompanyCasesRequest, CompanyCasesResponse,
-        UpdatedCasesRequest, UpdatedCasesResponse
-    )
-    from src.dol_analytics.api.routes.predictions import verify_recaptcha
-    from src.dol_analytics.middleware.rate_limiter import check_rate_limit, rate_limiter
+from ...config import get_settings
+from ...models.database import get_postgres_connection, run_with_connection, execute_prepared, MONTH_NUM_SQL
+from ...models.schemas import (
+    DailyVolumeData, WeeklyAverageData, WeeklyVolumeData, MonthlyVolumeData, 
+    TodaysProgressData, MonthlyBacklogData, PermCaseActivityData, PermCasesMetrics,
+    CompanySearchRequest, CompanySearchResponse, CompanyCasesRequest, CompanyCasesResponse,
+    UpdatedCasesRequest, UpdatedCasesResponse
+)
+from ..routes.predictions import verify_recaptcha, prediction_baseline_cache
+from ...middleware.rate_limiter import check_rate_limit, rate_limiter
+from ...services.cache import TTLCache
+from ...services.serialization import ORJSONResponse, encode_json
+
+settings = get_settings()
 
 router = APIRouter(prefix="/data", tags=["data"])
 
+logger = logging.getLogger("dol_analytics.data")
+
 # Cache settings
 CACHE_TIMEOUT = 3600  # 1 hour in seconds
-last_cache_reset = {}  # Track last reset time by endpoint
 
-# Dashboard cache with keys for common time periods
-dashboard_cache = {}
+# Totals for company/updated cases stop counting past this many rows
+TOTAL_COUNT_CAP = 10000
+
+# Month names by month number - 1, for months that come back from SQL as numbers
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+# Weekday names indexed like date.weekday() (Monday is 0)
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Time periods the frontend offers, precomputed by warm_dashboard_cache
+COMMON_DASHBOARD_DAYS = (7, 30, 90, 180)
+
+# Dashboard payloads as encoded JSON bytes, keyed by (days, data_type). Expired entries are still served
+# for up to another CACHE_TIMEOUT while a background task rebuilds them.
+dashboard_cache = TTLCache(ttl=CACHE_TIMEOUT, maxsize=len(COMMON_DASHBOARD_DAYS) * 2, stale_ttl=CACHE_TIMEOUT)
+
+# Browsers and proxies may reuse a dashboard response for 5 minutes, then
+# revalidate it against its ETag
+DASHBOARD_CACHE_CONTROL = "public, max-age=300"
+
+# Other periods (days accepts 1-365) get their own small cache, so unusual
+# requests can't evict the common periods
+uncommon_dashboard_cache = TTLCache(ttl=CACHE_TIMEOUT, maxsize=16)
+
+# Query results that change at most daily and don't depend on the dashboard
+# period or data type, shared by every payload build (and /processing-times,
+# which reads the same single entry)
+SHARED_DATA_TIMEOUT = 300  # 5 minutes in seconds
+shared_data_cache = TTLCache(ttl=SHARED_DATA_TIMEOUT, maxsize=16)
+
+# The standalone /monthly-backlog endpoint's ranges vary with its months
+# parameter, so it gets its own cache and can't evict the dashboard's entries
+monthly_backlog_cache = TTLCache(ttl=SHARED_DATA_TIMEOUT, maxsize=36)
+
+# Dashboard data types and the volume column each one reads
+DataType = Literal["certified", "processed"]
 
 
 # Request/Response models are now defined in schemas.py
 
-def should_reset_cache(endpoint):
-    """Check if cache should be reset based on timeout."""
-    now = datetime.now()
-    if endpoint not in last_cache_reset or (now - last_cache_reset[endpoint]).total_seconds() > CACHE_TIMEOUT:
-        print(f"Cache expired for {endpoint} - refreshing")
-        last_cache_reset[endpoint] = now
-        return True
-    return False
+def encode_case_cursor(submit_date: date, case_number: str) -> str:
+    """Encode the (submit_date, case_number) sort key of a page's last case as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{submit_date.isoformat()}|{case_number}".encode()).decode()
+
+
+def decode_case_cursor(cursor: str):
+    """Decode a cursor from encode_case_cursor. Raises ValueError if it is malformed."""
+    submit_date, case_number = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+    return date.fromisoformat(submit_date), case_number
 
 
 @router.post("/clear-cache")
@@ -56,10 +92,13 @@ async def clear_dashboard_cache():
     Clear the dashboard cache manually.
     Useful during development or when fresh data is needed immediately.
     """
-    global dashboard_cache, last_cache_reset
+    cleared_items = len(dashboard_cache) + len(uncommon_dashboard_cache)
     dashboard_cache.clear()
-    last_cache_reset.clear()
-    return {"message": "Dashboard cache cleared successfully", "cleared_items": len(dashboard_cache)}
+    uncommon_dashboard_cache.clear()
+    shared_data_cache.clear()
+    monthly_backlog_cache.clear()
+    prediction_baseline_cache.clear()
+    return {"message": "Dashboard cache cleared successfully", "cleared_items": cleared_items}
 
 
 @router.get("/admin/rate-limit-stats")
@@ -105,50 +144,24 @@ async def search_companies(
     """
     # Log the request for monitoring
     client_ip = rate_limiter.get_client_ip(http_request)
-    print(f"🔍 Company search request from IP: {client_ip}, query: '{request.query[:50]}...'")
+    logger.info("Company search request from IP: %s, query: '%s...'", client_ip, request.query[:50])
     
     # Verify reCAPTCHA token before processing
-    if not verify_recaptcha(request.recaptcha_token):
-        print(f"❌ Invalid reCAPTCHA from IP: {client_ip}")
+    if not await verify_recaptcha(request.recaptcha_token, client_ip):
+        logger.warning("Invalid reCAPTCHA from IP: %s", client_ip)
         raise HTTPException(status_code=400, detail="Invalid reCAPTCHA. Please try again.")
     
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Search for companies that start with the query string
-            # Only include data from March 1st, 2024 onward and get unique company names
-            cursor.execute("""
-                WITH normalized_companies AS (
-                    SELECT DISTINCT
-                        -- Normalize company name: proper case, remove trailing periods
-                        INITCAP(TRIM(TRAILING '.' FROM employer_name)) as normalized_name,
-                        employer_name as original_name,
-                        LENGTH(TRIM(TRAILING '.' FROM employer_name)) as name_length
-                    FROM perm_cases
-                    WHERE UPPER(employer_name) LIKE UPPER(%s)
-                    AND submit_date >= '2024-03-01'
-                ),
-                grouped_companies AS (
-                    SELECT 
-                        normalized_name,
-                        MIN(original_name) as display_name,  -- Pick one representative name
-                        MIN(name_length) as min_length
-                    FROM normalized_companies
-                    GROUP BY normalized_name
-                )
-                SELECT display_name
-                FROM grouped_companies
-                ORDER BY min_length, normalized_name
-                LIMIT %s
-            """, (f"{request.query}%", request.limit))
-            
-            companies = cursor.fetchall()
-            
-            return {
-                "companies": [row["display_name"] for row in companies],
-                "total": len(companies),
-                "query": request.query
-            }
-            
+        companies = await run_in_threadpool(search_company_names, conn, request.query, request.limit)
+        
+        return {
+            "companies": companies,
+            "total": len(companies),
+            "query": request.query
+        }
+        
+    except psycopg2.extensions.QueryCanceledError:
+        raise HTTPException(status_code=503, detail="Timed out searching companies, please try again")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching companies: {str(e)}")
 
@@ -168,12 +181,10 @@ async def get_company_cases(
     """
     # Log the request for monitoring
     client_ip = rate_limiter.get_client_ip(http_request)
-    print(f"🏢 Company cases request from IP: {client_ip}, company: '{request.company_name[:50]}...', date range: {request.start_date} to {request.end_date}")
-    
-    # Verify reCAPTCHA token before processing
-    if not verify_recaptcha(request.recaptcha_token):
-        print(f"❌ Invalid reCAPTCHA from IP: {client_ip}")
-        raise HTTPException(status_code=400, detail="Invalid reCAPTCHA. Please try again.")
+    logger.info(
+        "Company cases request from IP: %s, company: '%s...', date range: %s to %s",
+        client_ip, request.company_name[:50], request.start_date, request.end_date
+    )
     
     # Validate date range
     if request.start_date > request.end_date:
@@ -203,57 +214,40 @@ async def get_company_cases(
             detail=f"Date range cannot exceed 2 weeks (14 days). Current range: {date_range_days} days"
         )
     
+    after = None
+    if request.cursor:
+        try:
+            after = decode_case_cursor(request.cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    
+    # Verify reCAPTCHA token before touching the database
+    if not await verify_recaptcha(request.recaptcha_token, client_ip):
+        logger.warning("Invalid reCAPTCHA from IP: %s", client_ip)
+        raise HTTPException(status_code=400, detail="Invalid reCAPTCHA. Please try again.")
+    
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Get total count for pagination (case-insensitive search with punctuation normalization)
-            cursor.execute("""
-                SELECT COUNT(*) as total
-                FROM perm_cases
-                WHERE UPPER(TRIM(TRAILING '.' FROM employer_name)) = UPPER(TRIM(TRAILING '.' FROM %s))
-                AND submit_date BETWEEN %s AND %s
-            """, (request.company_name, request.start_date, request.end_date))
-            
-            total_count = cursor.fetchone()["total"]
-            
-            # Get the cases with pagination (case-insensitive search with punctuation normalization)
-            cursor.execute("""
-                SELECT 
-                    case_number,
-                    job_title,
-                    submit_date,
-                    employer_name,
-                    employer_first_letter,
-                    status
-                FROM perm_cases
-                WHERE UPPER(TRIM(TRAILING '.' FROM employer_name)) = UPPER(TRIM(TRAILING '.' FROM %s))
-                AND submit_date BETWEEN %s AND %s
-                ORDER BY submit_date DESC
-                LIMIT %s OFFSET %s
-            """, (request.company_name, request.start_date, request.end_date, request.limit, request.offset))
-            
-            cases = cursor.fetchall()
-            
-            # Convert to list of dictionaries for JSON response
-            cases_list = []
-            for case in cases:
-                case_dict = dict(case)
-                # Convert dates to ISO format strings
-                if case_dict["submit_date"]:
-                    case_dict["submit_date"] = case_dict["submit_date"].isoformat()
-                cases_list.append(case_dict)
-            
-            return {
-                "cases": cases_list,
-                "total": total_count,
-                "limit": request.limit,
-                "offset": request.offset,
-                "company_name": request.company_name,
-                "date_range": {
-                    "start_date": request.start_date.isoformat(),
-                    "end_date": request.end_date.isoformat()
-                }
+        total_count, total_capped, cases_list, next_cursor = await run_in_threadpool(
+            get_company_cases_page, conn, request.company_name, request.start_date, request.end_date,
+            request.limit, request.offset, after
+        )
+        
+        return {
+            "cases": cases_list,
+            "total": total_count,
+            "total_capped": total_capped,
+            "limit": request.limit,
+            "offset": request.offset,
+            "next_cursor": next_cursor,
+            "company_name": request.company_name,
+            "date_range": {
+                "start_date": request.start_date.isoformat(),
+                "end_date": request.end_date.isoformat()
             }
-            
+        }
+        
+    except psycopg2.extensions.QueryCanceledError:
+        raise HTTPException(status_code=503, detail="Timed out retrieving company cases, please try again")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving company cases: {str(e)}")
 
@@ -285,155 +279,190 @@ async def get_updated_cases(
             detail=f"Date cannot be in the future. Maximum allowed date: {max_date.isoformat()}"
         )
     
+    after = None
+    if request.cursor:
+        try:
+            after = decode_case_cursor(request.cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Get total count for pagination
-            # Convert UTC updated_at to ET timezone and filter by date, excluding withdrawn cases
-            # Exclude cases submitted within 3 days of the update date to avoid new submissions
-            cursor.execute("""
-                SELECT COUNT(*) as total
-                FROM perm_cases
-                WHERE date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') = %s
-                AND submit_date < %s - INTERVAL '3 days'
-                AND status != 'WITHDRAWN'
-            """, (request.target_date, request.target_date))
-            
-            total_count = cursor.fetchone()["total"]
-            
-            # Get the cases with pagination
-            # Include status, previous_status and updated_at in the results, excluding withdrawn cases
-            # Exclude cases submitted within 3 days of the update date to avoid new submissions
-            cursor.execute("""
-                SELECT 
-                    COALESCE(case_number, '') as case_number,
-                    job_title,
-                    submit_date,
-                    employer_name,
-                    COALESCE(employer_first_letter, '') as employer_first_letter,
-                    COALESCE(status, '') as status,
-                    previous_status,
-                    updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York' as updated_at_et
-                FROM perm_cases
-                WHERE date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') = %s
-                AND submit_date < %s - INTERVAL '3 days'
-                AND status != 'WITHDRAWN'
-                ORDER BY submit_date DESC
-                LIMIT %s OFFSET %s
-            """, (request.target_date, request.target_date, request.limit, request.offset))
-            
-            cases = cursor.fetchall()
-            
-            # Convert to list of dictionaries for JSON response
-            cases_list = []
-            for case in cases:
-                case_dict = dict(case)
-                # Convert dates to ISO format strings
-                if case_dict["submit_date"]:
-                    case_dict["submit_date"] = case_dict["submit_date"].isoformat()
-                if case_dict["updated_at_et"]:
-                    case_dict["updated_at"] = case_dict["updated_at_et"].isoformat()
-                    del case_dict["updated_at_et"]  # Remove the temporary field name
-                
-                # Handle null values by providing defaults or None
-                if case_dict["job_title"] is None:
-                    case_dict["job_title"] = None  # Keep as None, schema now allows it
-                if case_dict["employer_name"] is None:
-                    case_dict["employer_name"] = None  # Keep as None, schema now allows it
-                if case_dict["previous_status"] is None:
-                    case_dict["previous_status"] = None  # Keep as None, schema allows it
-                    
-                cases_list.append(case_dict)
-            
-            return {
-                "cases": cases_list,
-                "total": total_count,
-                "limit": request.limit,
-                "offset": request.offset,
-                "target_date": request.target_date.isoformat(),
-                "timezone_note": "All timestamps are converted to Eastern Time (ET)"
-            }
-            
+        total_count, total_capped, cases_list, next_cursor = await run_in_threadpool(
+            get_updated_cases_page, conn, request.target_date, request.limit, request.offset, after
+        )
+        
+        return {
+            "cases": cases_list,
+            "total": total_count,
+            "total_capped": total_capped,
+            "limit": request.limit,
+            "offset": request.offset,
+            "next_cursor": next_cursor,
+            "target_date": request.target_date.isoformat(),
+            "timezone_note": "All timestamps are converted to Eastern Time (ET)"
+        }
+        
+    except psycopg2.extensions.QueryCanceledError:
+        raise HTTPException(status_code=503, detail="Timed out retrieving updated cases, please try again")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving updated cases: {str(e)}")
 
 
 @router.get("/dashboard")
 async def get_dashboard_data(
+    http_request: Request,
     days: int = Query(30, ge=1, le=365, description="Number of days to include in data"),
-    data_type: str = Query("certified", regex="^(certified|processed)$", description="Type of data to fetch: 'certified' or 'processed'"),
-    conn=Depends(get_postgres_connection)
+    data_type: DataType = Query("certified", description="Type of data to fetch: 'certified' or 'processed'"),
+    _rate_limit: None = Depends(check_rate_limit)
 ):
     """
     Get dashboard visualization data in the format expected by the frontend.
-    Uses caching for common time periods (7, 30, 90, 180 days).
+    Uses caching, with the common time periods (7, 30, 90, 180 days) precomputed at startup.
+    Responses carry an ETag, so browsers and proxies can revalidate with a 304.
     
     Parameters:
     - days: Number of days to include in data (1-365)
     - data_type: Type of data to fetch - 'certified' (uses certified_total column) or 'processed' (uses processed_total column)
     """
-    # Check if we should clear the cache
-    if should_reset_cache("dashboard"):
-        dashboard_cache.clear()
+    # Concurrent misses for the same period share one build; stale entries are
+    # served while they refresh in the background
+    cache = dashboard_cache if days in COMMON_DASHBOARD_DAYS else uncommon_dashboard_cache
+    body = await cache.get_or_set(
+        (days, data_type),
+        lambda: load_dashboard_payload(days, data_type)
+    )
     
-    # Create cache key that includes both days and data_type
-    cache_key = f"{days}_{data_type}"
+    # The cache holds the encoded JSON, so hits go straight to the wire
+    headers = {"ETag": dashboard_etag(body), "Cache-Control": DASHBOARD_CACHE_CONTROL}
+    if etag_matches(http_request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def dashboard_etag(body: bytes) -> str:
+    """
+    ETag for an encoded dashboard payload.
+    
+    Weak, since GZipMiddleware may send the same payload gzipped or not.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag, using weak comparison."""
+    if not if_none_match:
+        return False
     
-    # Check if we have this data period and type in cache
-    if cache_key in dashboard_cache:
-        print(f"🚀 Cache HIT: Serving dashboard data for {days} days ({data_type}) from cache")
-        return dashboard_cache[cache_key]
+    def opaque_tag(tag: str) -> str:
+        return tag[2:] if tag.startswith("W/") else tag
     
-    print(f"⏳ Cache MISS: Fetching dashboard data for {days} days ({data_type}) from database")
+    return any(
+        candidate == "*" or opaque_tag(candidate) == opaque_tag(etag)
+        for candidate in (part.strip() for part in if_none_match.split(","))
+    )
+
+
+async def load_dashboard_payload(days: int, data_type: DataType = "certified") -> bytes:
+    """Build a dashboard payload and encode it as JSON."""
+    logger.info("Cache MISS: Fetching dashboard data for %s days (%s) from database", days, data_type)
+    return encode_json(await build_dashboard_payload(days, data_type))
+
+
+def log_query_error(helper_name: str, error: Exception):
+    """
+    Log a failed query helper before it returns its empty default.
     
-    # Not in cache, generate the data
+    Queries cancelled by statement_timeout are expected when the database is
+    under load, so they get a warning; anything else logs a full traceback.
+    """
+    if isinstance(error, psycopg2.extensions.QueryCanceledError):
+        logger.warning("Query timed out in %s: %s", helper_name, error)
+    else:
+        logger.exception("Error in %s: %s", helper_name, error)
+
+
+# Dashboard helpers running at once across all payload builds. Several cache
+# refreshes can overlap, so this keeps their fan-out inside the connection
+# pool (DB_POOL_SIZE connections) with room left for the other endpoints.
+dashboard_query_slots = asyncio.Semaphore(max(1, settings.DB_POOL_SIZE - 2))
+
+
+async def run_dashboard_query(helper, *args):
+    """Run a query helper with run_with_connection in the threadpool, bounded by dashboard_query_slots."""
+    async with dashboard_query_slots:
+        return await run_in_threadpool(run_with_connection, helper, *args)
+
+
+async def get_shared_data(helper, *args):
+    """Run a query helper through shared_data_cache, keyed by the helper and its arguments."""
+    return await shared_data_cache.get_or_set(
+        (helper.__name__, *args), lambda: run_dashboard_query(helper, *args)
+    )
+
+
+async def build_dashboard_payload(days: int, data_type: DataType = "certified") -> Dict[str, Any]:
+    """Query and format the full dashboard payload for a time period and data type."""
     # Get start date based on number of days
     end_date = date.today()
     start_date = end_date - timedelta(days=days)
     
-    # Get data using existing helper functions
-    daily_volume_data = get_daily_volume_data(conn, start_date, end_date, data_type)
-    weekly_averages_data = get_weekly_averages_data(conn, start_date, end_date, data_type)
-    weekly_volumes_data = get_weekly_volumes_data(conn, start_date, end_date, data_type)
-    
-    # Get monthly volumes using the same date range as other data
-    monthly_volumes_data = get_monthly_volumes_data(conn, start_date, end_date, data_type)
-    
-    # Get today's progress with days parameter
-    todays_progress = get_todays_progress_data(conn, days)
-    
-    # Get current backlog from summary_stats
-    current_backlog = get_current_backlog(conn)
-    
-    # Get processing time metrics
-    processing_times = get_latest_processing_times(conn)
-    
-    # Get PERM cases activity data for the latest date with data
-    perm_cases_metrics = get_perm_cases_metrics(conn)
-    
     # Get ALL monthly backlog data (not just 12 months)
     # Go back to at least 2023
     backlog_start_date = date(2023, 1, 1)
-    monthly_backlog_data = get_monthly_backlog_data(conn, backlog_start_date, end_date)
+    
+    # Look up the latest summary date once, so today's progress and the PERM
+    # activity describe the same day
+    latest_date = await run_dashboard_query(get_latest_record_date)
+    
+    # The helpers are independent, so run them at the same time, each on its
+    # own connection; latency is the slowest query rather than the sum
+    (
+        daily_volume_rows,
+        weekly_volume_rows,
+        monthly_volume_rows,
+        todays_progress,
+        processing_times,
+        perm_cases_metrics,
+        monthly_backlog_data,
+    ) = await asyncio.gather(
+        # The volume series come back as plain tuples and are formatted below,
+        # skipping the per-row models the standalone endpoints return
+        run_dashboard_query(get_daily_volume_rows, start_date, end_date, data_type),
+        run_dashboard_query(get_weekly_volume_rows, start_date, end_date, data_type),
+        # Monthly volumes use the same date range as other data
+        run_dashboard_query(get_monthly_volume_rows, start_date, end_date, data_type),
+        # Today's progress with days parameter (also carries the current backlog)
+        run_dashboard_query(get_todays_progress_data, days, latest_date),
+        # Processing times and the monthly backlog are the same for every period
+        get_shared_data(get_latest_processing_times),
+        # PERM cases activity data for the latest date with data
+        run_dashboard_query(get_perm_cases_metrics, latest_date),
+        get_shared_data(get_monthly_backlog_data, backlog_start_date, end_date),
+    )
+    
+    # Weekday averages cover the same daily_progress rows, so derive them
+    # locally instead of paying another round-trip
+    weekly_average_rows = summarize_weekly_averages(daily_volume_rows)
     
     # Transform data to match frontend expectations
     formatted_daily_volume = [
-        {"date": item.date.isoformat(), "volume": item.count}
-        for item in daily_volume_data
+        {"date": day, "volume": volume}
+        for day, volume in daily_volume_rows
     ]
     
     formatted_weekly_averages = [
-        {"day": item.day_of_week, "average": item.average_volume}
-        for item in weekly_averages_data
+        {"day": day_of_week, "average": average_volume}
+        for day_of_week, average_volume in weekly_average_rows
     ]
     
     formatted_weekly_volumes = [
-        {"week": item.week_starting.isoformat(), "volume": item.total_volume}
-        for item in weekly_volumes_data
+        {"week": week_start, "volume": volume}
+        for week_start, volume in weekly_volume_rows
     ]
     
     formatted_monthly_volumes = [
-        {"month": f"{item.month} {item.year}", "volume": item.total_volume}
-        for item in monthly_volumes_data
+        {"month": f"{month} {year}", "volume": volume}
+        for year, month, volume in monthly_volume_rows
     ]
     
     formatted_monthly_backlog = [
@@ -465,7 +494,7 @@ async def get_dashboard_data(
             "most_active_letter": perm_cases_metrics["daily_activity"]["most_active_letter"],
             "most_active_month": perm_cases_metrics["daily_activity"]["most_active_month"],
             "total_certified_cases": perm_cases_metrics["daily_activity"]["total_certified_cases"],
-            "data_date": perm_cases_metrics["daily_activity"]["data_date"].isoformat()
+            "data_date": perm_cases_metrics["daily_activity"]["data_date"]
         },
         "latest_month_activity": {
             "activity_data": [
@@ -489,12 +518,11 @@ async def get_dashboard_data(
         "new_cases_change": todays_progress.new_cases_change,
         "processed_cases": todays_progress.processed_cases,
         "processed_cases_change": todays_progress.processed_cases_change,
-        "current_backlog": current_backlog,
+        "current_backlog": todays_progress.current_backlog,
         "processing_times": processing_times
     }
     
-    # Create result object
-    result = {
+    return {
         "daily_volume": formatted_daily_volume,
         "weekly_averages": formatted_weekly_averages,
         "weekly_volumes": formatted_weekly_volumes,
@@ -503,15 +531,24 @@ async def get_dashboard_data(
         "perm_cases": formatted_perm_cases,
         "metrics": metrics
     }
-    
-    # Cache the result for common time periods
-    dashboard_cache[cache_key] = result
-    print(f"📦 Cached dashboard data for {days} days ({data_type})")
-    
-    return result
 
 
-@router.get("/daily-volume")
+async def warm_dashboard_cache():
+    """
+    Precompute the dashboard payloads for the common time periods so the
+    first visitors after a deploy don't pay for a cold miss.
+    """
+    try:
+        for days in COMMON_DASHBOARD_DAYS:
+            for data_type in ("certified", "processed"):
+                dashboard_cache.set((days, data_type), await load_dashboard_payload(days, data_type))
+        
+        logger.info("Warmed dashboard cache for %s time periods", len(dashboard_cache))
+    except Exception as e:
+        logger.error("Error warming dashboard cache: %s", e)
+
+
+@router.get("/daily-volume", response_class=ORJSONResponse)
 async def get_daily_volume(
     start_date: Optional[date] = Query(None, description="Start date (defaults to 30 days ago)"),
     end_date: Optional[date] = Query(None, description="End date (defaults to today)"),
@@ -529,12 +566,12 @@ async def get_daily_volume(
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="Start date must be before end date")
     
-    daily_data = get_daily_volume_data(conn, start_date, end_date)
+    daily_data = await run_in_threadpool(get_daily_volume_data, conn, start_date, end_date)
     
-    return {"data": daily_data}
+    return ORJSONResponse({"data": daily_data})
 
 
-@router.get("/weekly-averages")
+@router.get("/weekly-averages", response_class=ORJSONResponse)
 async def get_weekly_averages(
     start_date: Optional[date] = Query(None, description="Start date (defaults to 30 days ago)"),
     end_date: Optional[date] = Query(None, description="End date (defaults to today)"),
@@ -552,12 +589,12 @@ async def get_weekly_averages(
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="Start date must be before end date")
     
-    weekly_data = get_weekly_averages_data(conn, start_date, end_date)
+    weekly_data = await run_in_threadpool(get_weekly_averages_data, conn, start_date, end_date)
     
-    return {"data": weekly_data}
+    return ORJSONResponse({"data": weekly_data})
 
 
-@router.get("/weekly-volumes")
+@router.get("/weekly-volumes", response_class=ORJSONResponse)
 async def get_weekly_volumes(
     start_date: Optional[date] = Query(None, description="Start date (defaults to 30 days ago)"),
     end_date: Optional[date] = Query(None, description="End date (defaults to today)"),
@@ -575,12 +612,12 @@ async def get_weekly_volumes(
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="Start date must be before end date")
     
-    weekly_data = get_weekly_volumes_data(conn, start_date, end_date)
+    weekly_data = await run_in_threadpool(get_weekly_volumes_data, conn, start_date, end_date)
     
-    return {"data": weekly_data}
+    return ORJSONResponse({"data": weekly_data})
 
 
-@router.get("/monthly-volumes")
+@router.get("/monthly-volumes", response_class=ORJSONResponse)
 async def get_monthly_volumes(
     start_date: Optional[date] = Query(None, description="Start date (defaults to 30 days ago)"),
     end_date: Optional[date] = Query(None, description="End date (defaults to today)"),
@@ -598,26 +635,25 @@ async def get_monthly_volumes(
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="Start date must be before end date")
     
-    monthly_data = get_monthly_volumes_data(conn, start_date, end_date)
+    monthly_data = await run_in_threadpool(get_monthly_volumes_data, conn, start_date, end_date)
     
-    return {"data": monthly_data}
+    return ORJSONResponse({"data": monthly_data})
 
 
-@router.get("/todays-progress")
+@router.get("/todays-progress", response_class=ORJSONResponse)
 async def get_todays_progress(
     days: int = Query(1, ge=1, le=365, description="Number of days to compare against"),
     conn=Depends(get_postgres_connection)
 ):
     """Get today's progress metrics."""
-    progress_data = get_todays_progress_data(conn, days)
+    progress_data = await run_in_threadpool(get_todays_progress_data, conn, days)
     
-    return progress_data
+    return ORJSONResponse(progress_data)
 
 
-@router.get("/monthly-backlog")
+@router.get("/monthly-backlog", response_class=ORJSONResponse)
 async def get_monthly_backlog(
-    months: int = Query(12, ge=1, le=36, description="Number of months to include"),
-    conn=Depends(get_postgres_connection)
+    months: int = Query(12, ge=1, le=36, description="Number of months to include")
 ):
     """Get monthly backlog data showing backlog (ANALYST REVIEW + RECONSIDERATION APPEALS), WITHDRAWN, DENIED, and RFI cases."""
     today = date.today()
@@ -630,28 +666,28 @@ async def get_monthly_backlog(
     for _ in range(months - 1):
         start_date = (start_date.replace(day=1) - timedelta(days=1)).replace(day=1)
     
-    backlog_data = get_monthly_backlog_data(conn, start_date, end_date)
+    backlog_data = await monthly_backlog_cache.get_or_set(
+        (start_date, end_date), lambda: run_dashboard_query(get_monthly_backlog_data, start_date, end_date)
+    )
     
-    return {"data": backlog_data}
+    return ORJSONResponse({"data": backlog_data})
 
 
-@router.get("/processing-times")
-async def get_processing_times(
-    conn=Depends(get_postgres_connection)
-):
+@router.get("/processing-times", response_class=ORJSONResponse)
+async def get_processing_times():
     """Get latest processing time estimates."""
-    processing_times = get_latest_processing_times(conn)
-    return processing_times
+    processing_times = await get_shared_data(get_latest_processing_times)
+    return ORJSONResponse(processing_times)
 
 
-@router.get("/perm-cases")
+@router.get("/perm-cases", response_class=ORJSONResponse)
 async def get_perm_cases(
     conn=Depends(get_postgres_connection)
 ):
     """Get PERM cases activity data for debugging and testing."""
-    perm_cases_metrics = get_perm_cases_metrics(conn)
+    perm_cases_metrics = await run_in_threadpool(get_perm_cases_metrics, conn)
     
-    return {
+    return ORJSONResponse({
         "daily_activity": {
             "activity_data": [
                 {
@@ -664,7 +700,7 @@ async def get_perm_cases(
             "most_active_letter": perm_cases_metrics["daily_activity"]["most_active_letter"],
             "most_active_month": perm_cases_metrics["daily_activity"]["most_active_month"],
             "total_certified_cases": perm_cases_metrics["daily_activity"]["total_certified_cases"],
-            "data_date": perm_cases_metrics["daily_activity"]["data_date"].isoformat()
+            "data_date": perm_cases_metrics["daily_activity"]["data_date"]
         },
         "latest_month_activity": {
             "activity_data": [
@@ -680,143 +716,421 @@ async def get_perm_cases(
             "latest_active_month": perm_cases_metrics["latest_month_activity"]["latest_active_month"],
             "total_certified_cases": perm_cases_metrics["latest_month_activity"]["total_certified_cases"]
         }
-    }
+    })
 
 
 # Helper functions to query PostgreSQL database
 
-def get_daily_volume_data(conn, start_date: date, end_date: date, data_type: str = "certified") -> List[DailyVolumeData]:
-    """Query daily_progress table for volume data using certified_total or processed_total columns."""
+def search_company_names(conn, query: str, limit: int) -> List[str]:
+    """Query perm_cases for distinct display names of companies starting with query."""
+    with conn.cursor() as cursor:
+        # Search for companies that start with the query string
+        # Only include data from March 1st, 2024 onward and get unique company names
+        # (the prefix is sent as a literal so the planner can use idx_perm_cases_emp_upper_prefix;
+        # keep the submit_date predicate identical to that partial index's)
+        cursor.execute("""
+            WITH normalized_companies AS (
+                SELECT DISTINCT
+                    -- Normalize company name: proper case, remove trailing periods
+                    INITCAP(TRIM(TRAILING '.' FROM employer_name)) as normalized_name,
+                    employer_name as original_name,
+                    LENGTH(TRIM(TRAILING '.' FROM employer_name)) as name_length
+                FROM perm_cases
+                WHERE UPPER(employer_name) LIKE UPPER(%s)
+                AND submit_date >= '2024-03-01'
+            ),
+            grouped_companies AS (
+                SELECT 
+                    normalized_name,
+                    MIN(original_name) as display_name,  -- Pick one representative name
+                    MIN(name_length) as min_length
+                FROM normalized_companies
+                GROUP BY normalized_name
+            )
+            SELECT display_name
+            FROM grouped_companies
+            ORDER BY min_length, normalized_name
+            LIMIT %s
+        """, (f"{query}%", limit))
+        
+        return [display_name for (display_name,) in cursor]
+
+
+def get_company_cases_page(conn, company_name: str, start_date: date, end_date: date, limit: int, offset: int, after=None):
+    """
+    Query one page of a company's perm_cases in a date range, newest first.
+    
+    Pages after the first are fetched with a keyset filter on the previous
+    page's last (submit_date, case_number) instead of OFFSET, so deep pages
+    don't scan and discard every earlier row. The total is only reported on
+    the first page: a short page gives it for free, otherwise it is counted
+    up to TOTAL_COUNT_CAP rows.
+    
+    Returns:
+        (total count or None, whether the total was capped, cases, next cursor or None)
+    """
+    with conn.cursor() as cursor:
+        # Get the cases with pagination (case-insensitive search with punctuation normalization)
+        # (case_number in ORDER BY is the COALESCEd output column, matching the keyset filter,
+        # so a NULL case number can't end up in a cursor)
+        if after is None:
+            execute_prepared(cursor, "company_cases_page", """
+                SELECT 
+                    COALESCE(case_number, '') as case_number,
+                    job_title,
+                    submit_date,
+                    employer_name,
+                    employer_first_letter,
+                    status
+                FROM perm_cases
+                WHERE UPPER(TRIM(TRAILING '.' FROM employer_name)) = UPPER(TRIM(TRAILING '.' FROM $1::text))
+                AND submit_date BETWEEN $2 AND $3
+                ORDER BY submit_date DESC, case_number DESC
+                LIMIT $4 OFFSET $5
+            """, (company_name, start_date, end_date, limit, offset))
+        else:
+            execute_prepared(cursor, "company_cases_after", """
+                SELECT 
+                    COALESCE(case_number, '') as case_number,
+                    job_title,
+                    submit_date,
+                    employer_name,
+                    employer_first_letter,
+                    status
+                FROM perm_cases
+                WHERE UPPER(TRIM(TRAILING '.' FROM employer_name)) = UPPER(TRIM(TRAILING '.' FROM $1::text))
+                AND submit_date BETWEEN $2 AND $3
+                AND (submit_date, COALESCE(case_number, '')) < ($4::date, $5::text)
+                ORDER BY submit_date DESC, case_number DESC
+                LIMIT $6
+            """, (company_name, start_date, end_date, *after, limit))
+        
+        rows = cursor.fetchall()
+        
+        total_count = None
+        total_capped = False
+        if after is None:
+            if len(rows) < limit and (rows or offset == 0):
+                # The page reached the end, so the total is known without counting
+                total_count = offset + len(rows)
+            else:
+                execute_prepared(cursor, "company_cases_count", """
+                    SELECT COUNT(*) as total
+                    FROM (
+                        SELECT 1
+                        FROM perm_cases
+                        WHERE UPPER(TRIM(TRAILING '.' FROM employer_name)) = UPPER(TRIM(TRAILING '.' FROM $1::text))
+                        AND submit_date BETWEEN $2 AND $3
+                        LIMIT $4
+                    ) capped
+                """, (company_name, start_date, end_date, TOTAL_COUNT_CAP + 1))
+                
+                total_count = cursor.fetchone()[0]
+                total_capped = total_count > TOTAL_COUNT_CAP
+                total_count = min(total_count, TOTAL_COUNT_CAP)
+        
+        # A full page means there may be more cases after the last one
+        next_cursor = None
+        if rows and len(rows) == limit:
+            next_cursor = encode_case_cursor(rows[-1][2], rows[-1][0])
+        
+        # Build the response rows straight from the tuples; the response model
+        # serializes the dates
+        cases_list = [
+            {
+                "case_number": case_number,
+                "job_title": job_title,
+                "submit_date": submit_date,
+                "employer_name": employer_name,
+                "employer_first_letter": employer_first_letter,
+                "status": status
+            }
+            for case_number, job_title, submit_date, employer_name, employer_first_letter, status, *_ in rows
+        ]
+        
+        return total_count, total_capped, cases_list, next_cursor
+
+
+def get_updated_cases_page(conn, target_date: date, limit: int, offset: int, after=None):
+    """
+    Query one page of perm_cases updated on target_date (ET), newest submissions first.
+    
+    Paginates like get_company_cases_page: keyset on (submit_date,
+    case_number) when a cursor is given, with the total reported on the
+    first page only and counted up to TOTAL_COUNT_CAP rows.
+    
+    Returns:
+        (total count or None, whether the total was capped, cases, next cursor or None)
+    """
+    with conn.cursor() as cursor:
+        # Get the cases with pagination
+        # Convert UTC updated_at to ET timezone and filter by date, excluding withdrawn cases
+        # Include status, previous_status and updated_at in the results
+        # Exclude cases submitted within 3 days of the update date to avoid new submissions
+        # (case_number in ORDER BY is the COALESCEd output column, matching the keyset filter)
+        if after is None:
+            execute_prepared(cursor, "updated_cases_page", """
+                SELECT 
+                    COALESCE(case_number, '') as case_number,
+                    job_title,
+                    submit_date,
+                    employer_name,
+                    COALESCE(employer_first_letter, '') as employer_first_letter,
+                    COALESCE(status, '') as status,
+                    previous_status,
+                    updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York' as updated_at_et
+                FROM perm_cases
+                WHERE date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') = $1::date
+                AND submit_date < $1::date - INTERVAL '3 days'
+                AND status != 'WITHDRAWN'
+                ORDER BY submit_date DESC, case_number DESC
+                LIMIT $2 OFFSET $3
+            """, (target_date, limit, offset))
+        else:
+            execute_prepared(cursor, "updated_cases_after", """
+                SELECT 
+                    COALESCE(case_number, '') as case_number,
+                    job_title,
+                    submit_date,
+                    employer_name,
+                    COALESCE(employer_first_letter, '') as employer_first_letter,
+                    COALESCE(status, '') as status,
+                    previous_status,
+                    updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York' as updated_at_et
+                FROM perm_cases
+                WHERE date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') = $1::date
+                AND submit_date < $1::date - INTERVAL '3 days'
+                AND status != 'WITHDRAWN'
+                AND (submit_date, COALESCE(case_number, '')) < ($2::date, $3::text)
+                ORDER BY submit_date DESC, case_number DESC
+                LIMIT $4
+            """, (target_date, *after, limit))
+        
+        rows = cursor.fetchall()
+        
+        total_count = None
+        total_capped = False
+        if after is None:
+            if len(rows) < limit and (rows or offset == 0):
+                # The page reached the end, so the total is known without counting
+                total_count = offset + len(rows)
+            else:
+                execute_prepared(cursor, "updated_cases_count", """
+                    SELECT COUNT(*) as total
+                    FROM (
+                        SELECT 1
+                        FROM perm_cases
+                        WHERE date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') = $1::date
+                        AND submit_date < $1::date - INTERVAL '3 days'
+                        AND status != 'WITHDRAWN'
+                        LIMIT $2
+                    ) capped
+                """, (target_date, TOTAL_COUNT_CAP + 1))
+                
+                total_count = cursor.fetchone()[0]
+                total_capped = total_count > TOTAL_COUNT_CAP
+                total_count = min(total_count, TOTAL_COUNT_CAP)
+        
+        # A full page means there may be more cases after the last one
+        next_cursor = None
+        if rows and len(rows) == limit:
+            next_cursor = encode_case_cursor(rows[-1][2], rows[-1][0])
+        
+        # Build the response rows straight from the tuples; the response model serializes
+        # the dates (job_title, employer_name and previous_status may be None; the schema allows it)
+        cases_list = [
+            {
+                "case_number": case_number,
+                "job_title": job_title,
+                "submit_date": submit_date,
+                "employer_name": employer_name,
+                "employer_first_letter": employer_first_letter,
+                "status": status,
+                "previous_status": previous_status,
+                "updated_at": updated_at_et
+            }
+            for (
+                case_number, job_title, submit_date, employer_name, employer_first_letter,
+                status, previous_status, updated_at_et, *_
+            ) in rows
+        ]
+        
+        return total_count, total_capped, cases_list, next_cursor
+
+
+# The volume queries pick certified_total or processed_total with a CASE on the
+# data type parameter ($3), so one prepared statement serves both data types
+DAILY_VOLUME_SQL = """
+    SELECT date, CASE WHEN $3::text = 'processed' THEN processed_total ELSE certified_total END as volume
+    FROM daily_progress
+    WHERE date BETWEEN $1 AND $2
+    AND CASE WHEN $3::text = 'processed' THEN processed_total ELSE certified_total END IS NOT NULL
+    ORDER BY date
+"""
+
+
+def get_daily_volume_rows(conn, start_date: date, end_date: date, data_type: DataType = "certified") -> List[tuple]:
+    """Query daily_progress table for (date, volume) rows using certified_total or processed_total columns."""
     try:
-        result = []
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Choose the appropriate column based on data_type
-            column_name = "certified_total" if data_type == "certified" else "processed_total"
-            
-            cursor.execute(f"""
-                SELECT date, {column_name} as volume
-                FROM daily_progress
-                WHERE date BETWEEN %s AND %s
-                AND {column_name} IS NOT NULL
-                ORDER BY date
-            """, (start_date, end_date))
+        with conn.cursor() as cursor:
+            execute_prepared(cursor, "daily_volume", DAILY_VOLUME_SQL, (start_date, end_date, data_type))
             
-            for row in cursor.fetchall():
-                result.append(DailyVolumeData(
-                    date=row['date'],
-                    count=int(row['volume']) if row['volume'] is not None else 0
-                ))
-        
-        return result
+            return [(day, int(volume) if volume is not None else 0) for day, volume in cursor]
     except Exception as e:
-        print(f"Error in get_daily_volume_data: {str(e)}")
+        log_query_error("get_daily_volume_rows", e)
         # Return empty list on error
         return []
 
 
-def get_weekly_averages_data(conn, start_date: date, end_date: date, data_type: str = "certified") -> List[WeeklyAverageData]:
+def get_daily_volume_data(conn, start_date: date, end_date: date, data_type: DataType = "certified") -> List[DailyVolumeData]:
+    """Daily volume data as DailyVolumeData models."""
+    return [
+        DailyVolumeData.model_construct(date=day, count=volume)
+        for day, volume in get_daily_volume_rows(conn, start_date, end_date, data_type)
+    ]
+
+
+WEEKLY_AVERAGES_SQL = """
+    SELECT day_of_week, AVG(CASE WHEN $3::text = 'processed' THEN processed_total ELSE certified_total END) as average_volume
+    FROM daily_progress
+    WHERE date BETWEEN $1 AND $2
+    AND CASE WHEN $3::text = 'processed' THEN processed_total ELSE certified_total END IS NOT NULL
+    GROUP BY day_of_week, EXTRACT(ISODOW FROM date)
+    ORDER BY EXTRACT(ISODOW FROM date)
+"""
+
+
+def get_weekly_averages_data(conn, start_date: date, end_date: date, data_type: DataType = "certified") -> List[WeeklyAverageData]:
     """Query daily_progress table for weekly averages by day of week using certified_total or processed_total columns."""
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Choose the appropriate column based on data_type
-            column_name = "certified_total" if data_type == "certified" else "processed_total"
-            
-            cursor.execute(f"""
-                SELECT day_of_week, AVG({column_name}) as average_volume
-                FROM daily_progress
-                WHERE date BETWEEN %s AND %s
-                AND {column_name} IS NOT NULL
-                GROUP BY day_of_week
-                ORDER BY CASE day_of_week
-                    WHEN 'Monday' THEN 1
-                    WHEN 'Tuesday' THEN 2
-                    WHEN 'Wednesday' THEN 3
-                    WHEN 'Thursday' THEN 4
-                    WHEN 'Friday' THEN 5
-                    WHEN 'Saturday' THEN 6
-                    WHEN 'Sunday' THEN 7
-                END
-            """, (start_date, end_date))
+        with conn.cursor() as cursor:
+            execute_prepared(cursor, "weekly_averages", WEEKLY_AVERAGES_SQL, (start_date, end_date, data_type))
             
             result = []
-            for row in cursor.fetchall():
-                result.append(WeeklyAverageData(
-                    day_of_week=row['day_of_week'],
-                    average_volume=float(row['average_volume'])
+            for day_of_week, average_volume in cursor:
+                result.append(WeeklyAverageData.model_construct(
+                    day_of_week=day_of_week,
+                    average_volume=float(average_volume)
                 ))
             
             return result
     except Exception as e:
-        print(f"Error in get_weekly_averages_data: {str(e)}")
+        log_query_error("get_weekly_averages_data", e)
         # Return empty list on error
         return []
 
 
-def get_weekly_volumes_data(conn, start_date: date, end_date: date, data_type: str = "certified") -> List[WeeklyVolumeData]:
-    """Query weekly_summary view for weekly volume data using certified_total or processed_total columns."""
+def summarize_weekly_averages(daily_volume_rows: List[tuple]) -> List[tuple]:
+    """
+    Average (date, volume) rows by day of week, Monday first, as
+    (day_of_week, average_volume) rows matching get_weekly_averages_data.
+    """
+    totals = [0] * 7
+    counts = [0] * 7
+    
+    for day, volume in daily_volume_rows:
+        weekday = day.weekday()
+        totals[weekday] += volume
+        counts[weekday] += 1
+    
+    return [
+        (WEEKDAY_NAMES[i], totals[i] / counts[i])
+        for i in range(7)
+        if counts[i]
+    ]
+
+
+WEEKLY_VOLUMES_SQL = """
+    SELECT week_start, CASE WHEN $3::text = 'processed' THEN processed_total ELSE certified_total END as total_applications
+    FROM weekly_summary
+    WHERE week_start BETWEEN $1 AND $2
+    ORDER BY week_start
+"""
+
+
+def get_weekly_volume_rows(conn, start_date: date, end_date: date, data_type: DataType = "certified") -> List[tuple]:
+    """Query weekly_summary view for (week_start, volume) rows using certified_total or processed_total columns."""
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Choose the appropriate column based on data_type
-            column_name = "certified_total" if data_type == "certified" else "processed_total"
-            
-            cursor.execute(f"""
-                SELECT week_start, {column_name} as total_applications
-                FROM weekly_summary
-                WHERE week_start BETWEEN %s AND %s
-                ORDER BY week_start
-            """, (start_date, end_date))
-            
-            result = []
-            for row in cursor.fetchall():
-                result.append(WeeklyVolumeData(
-                    week_starting=row['week_start'],
-                    total_volume=row['total_applications']
-                ))
+        with conn.cursor() as cursor:
+            execute_prepared(cursor, "weekly_volumes", WEEKLY_VOLUMES_SQL, (start_date, end_date, data_type))
             
-            return result
+            return [
+                (week_start, int(total_applications) if total_applications is not None else 0)
+                for week_start, total_applications in cursor
+            ]
     except Exception as e:
-        print(f"Error in get_weekly_volumes_data: {str(e)}")
+        log_query_error("get_weekly_volume_rows", e)
         # Return empty list on error
         return []
 
 
-def get_monthly_volumes_data(conn, start_date: date, end_date: date, data_type: str = "certified") -> List[MonthlyVolumeData]:
-    """Query monthly_summary view for monthly volume data using certified_total or processed_total columns."""
+def get_weekly_volumes_data(conn, start_date: date, end_date: date, data_type: DataType = "certified") -> List[WeeklyVolumeData]:
+    """Weekly volume data as WeeklyVolumeData models."""
+    return [
+        WeeklyVolumeData.model_construct(week_starting=week_start, total_volume=volume)
+        for week_start, volume in get_weekly_volume_rows(conn, start_date, end_date, data_type)
+    ]
+
+
+MONTHLY_VOLUMES_SQL = """
+    SELECT 
+        EXTRACT(YEAR FROM year)::INTEGER as year,
+        EXTRACT(MONTH FROM month)::INTEGER as month_num,
+        CASE WHEN $3::text = 'processed' THEN processed_total ELSE certified_total END as total_volume
+    FROM monthly_summary
+    WHERE month BETWEEN $1 AND $2
+    ORDER BY year, month
+"""
+
+
+def get_monthly_volume_rows(conn, start_date: date, end_date: date, data_type: DataType = "certified") -> List[tuple]:
+    """Query monthly_summary view for (year, month_name, volume) rows using certified_total or processed_total columns."""
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Choose the appropriate column based on data_type
-            column_name = "certified_total" if data_type == "certified" else "processed_total"
-            
+        with conn.cursor() as cursor:
             # Query the monthly_summary view using date range
-            cursor.execute(f"""
-                SELECT 
-                    EXTRACT(YEAR FROM year)::INTEGER as year,
-                    TO_CHAR(month, 'Month') as month_name,
-                    {column_name} as total_volume
-                FROM monthly_summary
-                WHERE month BETWEEN %s AND %s
-                ORDER BY year, month
-            """, (start_date, end_date))
+            execute_prepared(cursor, "monthly_volumes", MONTHLY_VOLUMES_SQL, (start_date, end_date, data_type))
             
-            result = []
-            for row in cursor.fetchall():
-                # Convert month_name to proper format (remove trailing spaces)
-                month_name = row['month_name'].strip()
-                
-                result.append(MonthlyVolumeData(
-                    month=month_name,
-                    year=row['year'],
-                    total_volume=row['total_volume']
-                ))
-            
-            return result
+            return [
+                (year, MONTH_NAMES[month_num - 1], int(total_volume) if total_volume is not None else 0)
+                for year, month_num, total_volume in cursor
+            ]
     except Exception as e:
-        print(f"Error in get_monthly_volumes_data: {str(e)}")
+        log_query_error("get_monthly_volume_rows", e)
         # Return empty list on error
         return []
 
 
-def get_todays_progress_data(conn, comparison_days: int = 1) -> TodaysProgressData:
+def get_monthly_volumes_data(conn, start_date: date, end_date: date, data_type: DataType = "certified") -> List[MonthlyVolumeData]:
+    """Monthly volume data as MonthlyVolumeData models."""
+    return [
+        MonthlyVolumeData.model_construct(month=month, year=year, total_volume=volume)
+        for year, month, volume in get_monthly_volume_rows(conn, start_date, end_date, data_type)
+    ]
+
+
+def percent_change(current, baseline) -> float:
+    """Percentage change from baseline to current, or 0 when there is no baseline."""
+    if not baseline or baseline <= 0:
+        return 0.0
+    return float((current - baseline) / baseline * 100)
+
+
+def get_latest_record_date(conn) -> date:
+    """Get the latest date with data in summary_stats, or today if there is none."""
+    try:
+        with conn.cursor() as cursor:
+            execute_prepared(cursor, "latest_record_date", """
+                SELECT MAX(record_date) as latest_date
+                FROM summary_stats
+            """)
+            latest_row = cursor.fetchone()
+            return latest_row[0] if latest_row and latest_row[0] else date.today()
+    except Exception as e:
+        log_query_error("get_latest_record_date", e)
+        return date.today()
+
+
+def get_todays_progress_data(conn, comparison_days: int = 1, latest_date: Optional[date] = None) -> TodaysProgressData:
     """
     Get today's progress metrics with comparison to the average of all
     matching weekdays in the selected period.
@@ -828,38 +1142,51 @@ def get_todays_progress_data(conn, comparison_days: int = 1) -> TodaysProgressDa
     Args:
         conn: Database connection
         comparison_days: Dashboard period (7, 30, etc.)
+        latest_date: Latest date with data, looked up when not given
     """
     try:
-        today = date.today()
+        if latest_date is None:
+            latest_date = get_latest_record_date(conn)
         
         with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Find the latest date with data
-            cursor.execute("""
-                SELECT MAX(record_date) as latest_date
-                FROM summary_stats
-            """)
-            latest_row = cursor.fetchone()
-            latest_date = latest_row['latest_date'] if latest_row and latest_row['latest_date'] else today
-            
-            # Get today's data and day of week
-            cursor.execute("""
-                SELECT 
-                    changes_today as new_cases, 
-                    completed_today as processed_cases,
-                    EXTRACT(DOW FROM record_date) as day_of_week
-                FROM summary_stats
-                WHERE record_date = %s
-            """, (latest_date,))
+            # Get the latest day's data and its comparison in one round trip:
+            # - latest: the summary row for the latest date, with its day of week and backlog
+            # - comparison: average of the same weekday over the period before it.
+            #   Periods of 7 days or less look back exactly a week, so the average is
+            #   just last week's row for that weekday
+            execute_prepared(cursor, "todays_progress", """
+                WITH latest AS (
+                    SELECT 
+                        record_date,
+                        changes_today as new_cases, 
+                        completed_today as processed_cases,
+                        pending_applications as backlog,
+                        EXTRACT(DOW FROM record_date) as day_of_week
+                    FROM summary_stats
+                    WHERE record_date = $2::date
+                ),
+                comparison AS (
+                    SELECT 
+                        AVG(s.changes_today) as avg_new_cases, 
+                        AVG(s.completed_today) as avg_processed_cases,
+                        COUNT(*) as count_days
+                    FROM summary_stats s, latest
+                    WHERE s.record_date < latest.record_date
+                      AND s.record_date >= latest.record_date - GREATEST($1::int, 7)
+                      AND EXTRACT(DOW FROM s.record_date) = latest.day_of_week
+                )
+                SELECT * FROM latest CROSS JOIN comparison
+            """, (comparison_days, latest_date))
             
-            today_row = cursor.fetchone()
+            row = cursor.fetchone()
             
-            if not today_row:
+            if not row:
                 # No data for latest date
-                return TodaysProgressData(
+                return TodaysProgressData.model_construct(
                     new_cases=0,
                     processed_cases=0,
-                    new_cases_change=0,
-                    processed_cases_change=0,
+                    new_cases_change=0.0,
+                    processed_cases_change=0.0,
                     date=latest_date,
                     current_backlog=0,
                     comparison_days=comparison_days,
@@ -867,80 +1194,28 @@ def get_todays_progress_data(conn, comparison_days: int = 1) -> TodaysProgressDa
                     period_label="Today"
                 )
             
-            # Get the day of week (0=Sunday, 1=Monday, etc.)
-            day_of_week = int(today_row['day_of_week'])
-            weekday_name = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"][day_of_week]
+            # Postgres DOW counts from Sunday (0=Sunday, 1=Monday, etc.)
+            day_of_week = int(row['day_of_week'])
+            weekday_name = WEEKDAY_NAMES[(day_of_week - 1) % 7]
+            
+            comparison_new = row['avg_new_cases'] or 0
+            comparison_processed = row['avg_processed_cases'] or 0
             
-            # For 7 days or less, just compare to last week on same day
             if comparison_days <= 7:
-                comparison_date = latest_date - timedelta(days=7)
-                
-                cursor.execute("""
-                    SELECT 
-                        changes_today as new_cases, 
-                        completed_today as processed_cases
-                    FROM summary_stats
-                    WHERE record_date = %s
-                """, (comparison_date,))
-                
-                comparison_row = cursor.fetchone()
-                
-                comparison_new = comparison_row['new_cases'] if comparison_row and comparison_row['new_cases'] else 0
-                comparison_processed = comparison_row['processed_cases'] if comparison_row and comparison_row['processed_cases'] else 0
-                
                 comparison_label = f"Last {weekday_name}"
-                
             else:
-                # For more than 7 days, compare to average of all matching weekdays in period
-                period_start = latest_date - timedelta(days=comparison_days)
-                
-                # Find all matching weekdays in the period excluding today
-                cursor.execute("""
-                    SELECT 
-                        AVG(changes_today) as avg_new_cases, 
-                        AVG(completed_today) as avg_processed_cases,
-                        COUNT(*) as count_days
-                    FROM summary_stats
-                    WHERE record_date < %s
-                      AND record_date >= %s
-                      AND EXTRACT(DOW FROM record_date) = %s
-                """, (latest_date, period_start, day_of_week))
-                
-                weekday_avg_row = cursor.fetchone()
-                
-                comparison_new = weekday_avg_row['avg_new_cases'] if weekday_avg_row and weekday_avg_row['avg_new_cases'] else 0
-                comparison_processed = weekday_avg_row['avg_processed_cases'] if weekday_avg_row and weekday_avg_row['avg_processed_cases'] else 0
-                days_count = int(weekday_avg_row['count_days'] if weekday_avg_row and weekday_avg_row['count_days'] else 0)
-                
-                comparison_label = f"Avg {weekday_name}s ({days_count})"
-            
-            # Get current backlog
-            cursor.execute("""
-                SELECT pending_applications as backlog
-                FROM summary_stats
-                WHERE record_date = %s
-            """, (latest_date,))
+                comparison_label = f"Avg {weekday_name}s ({int(row['count_days'])})"
             
-            backlog_row = cursor.fetchone()
-            current_backlog = backlog_row['backlog'] if backlog_row else 0
+            new_cases = row['new_cases'] or 0
+            processed_cases = row['processed_cases'] or 0
+            current_backlog = row['backlog'] or 0
             
-            # Calculate changes
-            new_cases = today_row['new_cases'] or 0
-            processed_cases = today_row['processed_cases'] or 0
-            
-            new_cases_change = 0
-            if comparison_new > 0:
-                new_cases_change = ((new_cases - comparison_new) / comparison_new) * 100
-            
-            processed_cases_change = 0
-            if comparison_processed > 0:
-                processed_cases_change = ((processed_cases - comparison_processed) / comparison_processed) * 100
-            
-            return TodaysProgressData(
+            # Every value is already converted, so build the model without validation
+            return TodaysProgressData.model_construct(
                 new_cases=int(new_cases),
                 processed_cases=int(processed_cases),
-                new_cases_change=new_cases_change,
-                processed_cases_change=processed_cases_change,
+                new_cases_change=percent_change(new_cases, comparison_new),
+                processed_cases_change=percent_change(processed_cases, comparison_processed),
                 date=latest_date,
                 current_backlog=int(current_backlog),
                 comparison_days=comparison_days,
@@ -948,16 +1223,13 @@ def get_todays_progress_data(conn, comparison_days: int = 1) -> TodaysProgressDa
                 period_label=weekday_name  # Today is a specific weekday
             )
     except Exception as e:
-        print(f"Error in get_todays_progress_data: {str(e)}")
-        print(f"Exception type: {type(e)}")
-        import traceback
-        print(traceback.format_exc())
+        log_query_error("get_todays_progress_data", e)
         # Return default data on error
-        return TodaysProgressData(
+        return TodaysProgressData.model_construct(
             new_cases=0,
             processed_cases=0,
-            new_cases_change=0,
-            processed_cases_change=0,
+            new_cases_change=0.0,
+            processed_cases_change=0.0,
             date=date.today(),
             current_backlog=0,
             comparison_days=comparison_days,
@@ -966,157 +1238,52 @@ def get_todays_progress_data(conn, comparison_days: int = 1) -> TodaysProgressDa
         )
 
 
-def get_current_backlog(conn) -> int:
-    """Query summary_stats table for current backlog."""
-    try:
-        with conn.cursor() as cursor:
-            cursor.execute("""
-                SELECT pending_applications
-                FROM summary_stats
-                ORDER BY record_date DESC
-                LIMIT 1
-            """)
-            
-            row = cursor.fetchone()
-            return row[0] if row else 0
-    except Exception as e:
-        print(f"Error in get_current_backlog: {str(e)}")
-        return 0
-
-
 def get_monthly_backlog_data(conn, start_date: date, end_date: date) -> List[MonthlyBacklogData]:
     """Query monthly_status table for backlog (ANALYST REVIEW + RECONSIDERATION APPEALS), WITHDRAWN, DENIED, and RFI cases by month."""
+    # Months whose first day falls in the range, as (year, month number) bounds
+    first_month = (start_date.year, start_date.month)
+    if start_date.day > 1:
+        first_month = (start_date.year + 1, 1) if start_date.month == 12 else (start_date.year, start_date.month + 1)
+    last_month = (end_date.year, end_date.month)
+    
     try:
-        # Month name to number mapping
-        month_to_num = {
-            'January': 1, 'February': 2, 'March': 3, 'April': 4,
-            'May': 5, 'June': 6, 'July': 7, 'August': 8,
-            'September': 9, 'October': 10, 'November': 11, 'December': 12
-        }
-        
-        result_dict = {}
-        
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Get backlog cases (ANALYST REVIEW + RECONSIDERATION APPEALS) and other statuses
-            cursor.execute("""
-                SELECT 
-                    ms.year, 
-                    ms.month, 
-                    SUM(ms.count) AS count, 
-                    'BACKLOG' AS status,
-                    BOOL_OR(COALESCE(ms.is_active, FALSE)) AS is_active
-                FROM monthly_status ms
-                WHERE ms.status IN ('ANALYST REVIEW', 'RECONSIDERATION APPEALS')
-                GROUP BY ms.year, ms.month
-                
-                UNION ALL
-                
-                SELECT 
-                    year, 
-                    month, 
-                    count, 
-                    'WITHDRAWN' AS status,
-                    FALSE AS is_active
-                FROM monthly_status
-                WHERE status = 'WITHDRAWN'
-                
-                UNION ALL
-                
-                SELECT 
-                    year, 
-                    month, 
-                    count, 
-                    'DENIED' AS status,
-                    FALSE AS is_active
-                FROM monthly_status
-                WHERE status = 'DENIED'
-                
-                UNION ALL
-                
-                SELECT 
-                    year, 
-                    month, 
-                    count, 
-                    'RFI ISSUED' AS status,
-                    FALSE AS is_active
-                FROM monthly_status
-                WHERE status = 'RFI ISSUED'
-                
-                UNION ALL
-                
+        with conn.cursor() as cursor:
+            # Pivot backlog cases (ANALYST REVIEW + RECONSIDERATION APPEALS) and other statuses
+            # into one row per month in our date range
+            execute_prepared(cursor, "monthly_backlog", f"""
                 SELECT 
                     year, 
                     month, 
-                    count, 
-                    'CERTIFIED' AS status,
-                    FALSE AS is_active
+                    COALESCE(SUM(count) FILTER (WHERE status IN ('ANALYST REVIEW', 'RECONSIDERATION APPEALS')), 0) AS backlog,
+                    COALESCE(BOOL_OR(COALESCE(is_active, FALSE)) FILTER (WHERE status IN ('ANALYST REVIEW', 'RECONSIDERATION APPEALS')), FALSE) AS is_active,
+                    COALESCE(SUM(count) FILTER (WHERE status = 'WITHDRAWN'), 0) AS withdrawn,
+                    COALESCE(SUM(count) FILTER (WHERE status = 'DENIED'), 0) AS denied,
+                    COALESCE(SUM(count) FILTER (WHERE status = 'RFI ISSUED'), 0) AS rfi,
+                    COALESCE(SUM(count) FILTER (WHERE status = 'CERTIFIED'), 0) AS certified
                 FROM monthly_status
-                WHERE status = 'CERTIFIED'
-                
-                ORDER BY year, month
-            """)
+                WHERE (year, {MONTH_NUM_SQL}) >= ($1, $2) AND (year, {MONTH_NUM_SQL}) <= ($3, $4)
+                AND status IN ('ANALYST REVIEW', 'RECONSIDERATION APPEALS', 'WITHDRAWN', 'DENIED', 'RFI ISSUED', 'CERTIFIED')
+                GROUP BY year, month
+                ORDER BY year, {MONTH_NUM_SQL}
+            """, (*first_month, *last_month))
             
-            # Process results into a dictionary keyed by (year, month)
-            for row in cursor.fetchall():
-                year = row['year']
-                month = row['month']
-                key = (year, month)
-                month_num = month_to_num.get(month, 0)
-                
-                # Skip months outside our date range
-                row_date = date(year, month_num, 1)
-                if row_date < start_date or row_date > end_date:
-                    continue
-                
-                # Initialize the record if we haven't seen this month yet
-                if key not in result_dict:
-                    result_dict[key] = {
-                        'year': year,
-                        'month': month,
-                        'backlog': 0,
-                        'is_active': False,
-                        'withdrawn': 0,
-                        'denied': 0,
-                        'rfi': 0,
-                        'certified': 0
-                    }
-                
-                # Update the appropriate field based on the status
-                if row['status'] == 'BACKLOG':
-                    result_dict[key]['backlog'] = row['count']
-                    result_dict[key]['is_active'] = row['is_active']
-                elif row['status'] == 'WITHDRAWN':
-                    result_dict[key]['withdrawn'] = row['count']
-                elif row['status'] == 'DENIED':
-                    result_dict[key]['denied'] = row['count']
-                elif row['status'] == 'RFI ISSUED':
-                    result_dict[key]['rfi'] = row['count']
-                elif row['status'] == 'CERTIFIED':
-                    result_dict[key]['certified'] = row['count']
-        
-        # Convert dictionary to sorted list of MonthlyBacklogData objects
-        sorted_keys = sorted(result_dict.keys(), key=lambda k: (k[0], month_to_num[k[1]]))
-        result = []
-        for key in sorted_keys:
-            data = result_dict[key]
-            # Calculate total count (all cases for this month)
-            total_count = (data['backlog'] + data['certified'] + data['withdrawn'] + 
-                          data['denied'] + data['rfi'])
-            result.append(MonthlyBacklogData(
-                month=data['month'],
-                year=data['year'],
-                backlog=data['backlog'],
-                is_active=data['is_active'],
-                withdrawn=data['withdrawn'],
-                denied=data['denied'],
-                rfi=data['rfi'],
-                certified=data['certified'],
-                total_count=total_count
-            ))
-        
-        return result
+            # Total count is all cases for the month
+            return [
+                MonthlyBacklogData.model_construct(
+                    month=month,
+                    year=year,
+                    backlog=backlog,
+                    is_active=is_active,
+                    withdrawn=withdrawn,
+                    denied=denied,
+                    rfi=rfi,
+                    certified=certified,
+                    total_count=backlog + certified + withdrawn + denied + rfi
+                )
+                for year, month, backlog, is_active, withdrawn, denied, rfi, certified in cursor
+            ]
     except Exception as e:
-        print(f"Error in get_monthly_backlog_data: {str(e)}")
+        log_query_error("get_monthly_backlog_data", e)
         return []
 
 
@@ -1124,7 +1291,7 @@ def get_latest_processing_times(conn) -> Dict[str, Any]:
     """Query processing_times table for latest processing metrics."""
     try:
         with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            cursor.execute("""
+            execute_prepared(cursor, "latest_processing_times", """
                 SELECT 
                     percentile_30 as lower_estimate_days,
                     percentile_50 as median_days,
@@ -1140,10 +1307,10 @@ def get_latest_processing_times(conn) -> Dict[str, Any]:
             if row:
                 # Try to get the most recent case update time for this date
                 # Convert UTC to ET for proper date comparison
-                cursor.execute("""
+                execute_prepared(cursor, "latest_update_time", """
                     SELECT MAX(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') as latest_update_time
                     FROM perm_cases 
-                    WHERE date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') = %s
+                    WHERE date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') = $1::date
                 """, (row['record_date'],))
                 
                 update_time_row = cursor.fetchone()
@@ -1156,7 +1323,7 @@ def get_latest_processing_times(conn) -> Dict[str, Any]:
                     "lower_estimate_days": int(row['lower_estimate_days']) if row['lower_estimate_days'] is not None else None,
                     "median_days": int(row['median_days']) if row['median_days'] is not None else None,
                     "upper_estimate_days": int(row['upper_estimate_days']) if row['upper_estimate_days'] is not None else None,
-                    "as_of_date": as_of_datetime.isoformat() if as_of_datetime else (row['record_date'].isoformat() if row['record_date'] else None)
+                    "as_of_date": as_of_datetime if as_of_datetime else row['record_date']
                 }
             return {
                 "lower_estimate_days": None,
@@ -1165,7 +1332,7 @@ def get_latest_processing_times(conn) -> Dict[str, Any]:
                 "as_of_date": None
             }
     except Exception as e:
-        print(f"Error in get_latest_processing_times: {str(e)}")
+        log_query_error("get_latest_processing_times", e)
         return {
             "lower_estimate_days": None,
             "median_days": None, 
@@ -1174,151 +1341,101 @@ def get_latest_processing_times(conn) -> Dict[str, Any]:
         }
 
 
-def get_perm_cases_activity_data(conn) -> List[PermCaseActivityData]:
-    """Query perm_cases table for activity by employer first letter and month for the latest date with data."""
+def get_perm_cases_activity_rows(conn, latest_date: date) -> tuple:
+    """
+    Query perm_cases for both dashboard activity views in one round trip:
+    - Activity by employer first letter and month for the latest date with data
+    - Employer letters for the featured submission month
+    
+    Returns:
+        (daily_activity_data, latest_month_data) lists of PermCaseActivityData
+    """
+    # Use a fixed featured month (FEATURED_SUBMIT_MONTH/YEAR settings) for dashboard consistency
+    # This provides stable reporting regardless of daily processing variations
+    busiest_month = settings.FEATURED_SUBMIT_MONTH
+    featured_year = settings.FEATURED_SUBMIT_YEAR
+    month_start = date(featured_year, busiest_month, 1)
+    month_end = date(featured_year + busiest_month // 12, busiest_month % 12 + 1, 1)
+    
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Find the latest date with data (same pattern as get_todays_progress_data)
-            cursor.execute("""
-                SELECT MAX(record_date) as latest_date
-                FROM summary_stats
-            """)
-            latest_row = cursor.fetchone()
-            latest_date = latest_row['latest_date'] if latest_row and latest_row['latest_date'] else date.today()
-            print(f"🔍 Using latest data date: {latest_date}")
-            
-            # First, let's check if the table exists and has data
-            cursor.execute("""
-                SELECT COUNT(*) as total_count
-                FROM perm_cases
-            """)
-            total_row = cursor.fetchone()
-            total_count = total_row['total_count'] if total_row else 0
-            print(f"🔍 Total PERM cases in database: {total_count}")
-            
-            # Check how many certified cases exist
-            cursor.execute("""
-                SELECT COUNT(*) as certified_count
-                FROM perm_cases
-                WHERE status = 'CERTIFIED'
-            """)
-            certified_row = cursor.fetchone()
-            certified_count = certified_row['certified_count'] if certified_row else 0
-            print(f"🔍 Total CERTIFIED PERM cases: {certified_count}")
-            
-            # Query 1: Activity for the latest date with data - certified and processed counts
-            # Convert UTC updated_at to ET time before extracting date
-            cursor.execute("""
+        with conn.cursor() as cursor:
+            # Daily rows: certified and processed counts, converting UTC updated_at to ET
+            # before extracting the date
+            # Month rows: ALL certified and review cases for the featured submission month,
+            # not just recent certifications (as a submit_date range, so the index can be used)
+            execute_prepared(cursor, "perm_cases_activity", """
                 SELECT 
+                    'daily' as kind,
                     employer_first_letter, 
                     date_part('month', submit_date) as submit_month, 
                     SUM(CASE WHEN status = 'CERTIFIED' THEN 1 ELSE 0 END) as certified_count,
-                    COUNT(*) as processed_count
+                    COUNT(*) as extra_count
                 FROM perm_cases 
-                WHERE date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') = %s 
+                WHERE date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') = $1::date 
                 AND status IN ('CERTIFIED', 'DENIED', 'RFI ISSUED')
                 GROUP BY employer_first_letter, date_part('month', submit_date)
-                ORDER BY date_part('month', submit_date) ASC, employer_first_letter ASC
-            """, (latest_date,))
-            
-            result = []
-            for row in cursor.fetchall():
-                result.append(PermCaseActivityData(
-                    employer_first_letter=row['employer_first_letter'],
-                    submit_month=int(row['submit_month']),
-                    certified_count=int(row['certified_count']),
-                    processed_count=int(row['processed_count'])
-                ))
-            
-            print(f"🔍 Found {len(result)} activity records for {latest_date}")
-            
-            return result
-    except Exception as e:
-        print(f"Error in get_perm_cases_activity_data: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
-        return []
-
-
-def get_perm_cases_latest_month_data(conn) -> List[PermCaseActivityData]:
-    """Query 2: Get the busiest submission month from recent certification activity."""
-    try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Find the most recent update date (when work was done)
-            # Convert UTC to ET time for proper date comparison
-            cursor.execute("""
-                SELECT MAX(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York') as latest_update_date
-                FROM perm_cases 
-                WHERE status = 'CERTIFIED'
-            """)
-            
-            latest_update_row = cursor.fetchone()
-            if not latest_update_row or not latest_update_row['latest_update_date']:
-                print("🔍 No certified PERM cases found")
-                return []
-            
-            latest_update_date = latest_update_row['latest_update_date']
-            print(f"🔍 Most recent certification activity date (ET): {latest_update_date}")
-            
-            # Use September (month 9) as the featured month for dashboard consistency
-            # This provides stable reporting regardless of daily processing variations
-            busiest_month = 10  # September
-            print(f"🔍 Using September (month {busiest_month}) as featured month for dashboard")
-            
-            # Now get all employer data for that busiest month
-            # Get ALL certified and review cases for the busiest submission month, not just recent certifications
-            # Focus on 2024 data for current relevance
-            cursor.execute("""
+                
+                UNION ALL
+                
                 SELECT 
+                    'month' as kind,
                     employer_first_letter, 
-                    %s as submit_month,
-                    SUM(CASE WHEN status = 'CERTIFIED' THEN 1 ELSE 0 END) as case_count,
-                    SUM(CASE WHEN status IN ('ANALYST REVIEW', 'RECONSIDERATION APPEALS') THEN 1 ELSE 0 END) as review_count
+                    $2::int as submit_month,
+                    SUM(CASE WHEN status = 'CERTIFIED' THEN 1 ELSE 0 END) as certified_count,
+                    SUM(CASE WHEN status IN ('ANALYST REVIEW', 'RECONSIDERATION APPEALS') THEN 1 ELSE 0 END) as extra_count
                 FROM perm_cases 
-                WHERE date_part('month', submit_date) = %s
-                AND date_part('year', submit_date) = 2024
+                WHERE submit_date >= $3::date AND submit_date < $4::date
                 AND status IN ('CERTIFIED', 'ANALYST REVIEW', 'RECONSIDERATION APPEALS')
                 GROUP BY employer_first_letter
                 HAVING SUM(CASE WHEN status = 'CERTIFIED' THEN 1 ELSE 0 END) > 0
-                ORDER BY employer_first_letter ASC
-            """, (busiest_month, busiest_month))
+                
+                ORDER BY submit_month ASC, employer_first_letter ASC
+            """, (latest_date, busiest_month, month_start, month_end))
             
-            result = []
-            for row in cursor.fetchall():
-                result.append(PermCaseActivityData(
-                    employer_first_letter=row['employer_first_letter'],
-                    submit_month=int(row['submit_month']),
-                    certified_count=int(row['case_count']),
-                    review_count=int(row['review_count'])
-                ))
+            daily_activity_data = []
+            latest_month_data = []
+            for kind, employer_first_letter, submit_month, certified_count, extra_count in cursor:
+                if kind == 'daily':
+                    daily_activity_data.append(PermCaseActivityData.model_construct(
+                        employer_first_letter=employer_first_letter,
+                        submit_month=int(submit_month),
+                        certified_count=int(certified_count),
+                        processed_count=int(extra_count),
+                        review_count=None
+                    ))
+                else:
+                    latest_month_data.append(PermCaseActivityData.model_construct(
+                        employer_first_letter=employer_first_letter,
+                        submit_month=int(submit_month),
+                        certified_count=int(certified_count),
+                        processed_count=None,
+                        review_count=int(extra_count)
+                    ))
             
-            print(f"🔍 Found {len(result)} employers in busiest month {busiest_month}")
-            return result
+            logger.debug("Found %s activity records for %s", len(daily_activity_data), latest_date)
+            logger.debug("Found %s employers in featured month %s", len(latest_month_data), busiest_month)
             
+            return daily_activity_data, latest_month_data
     except Exception as e:
-        print(f"Error in get_perm_cases_latest_month_data: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
-        return []
+        log_query_error("get_perm_cases_activity_rows", e)
+        return [], []
 
 
-def get_perm_cases_metrics(conn) -> Dict[str, Any]:
-    """Get PERM cases metrics for dashboard integration with both queries."""
+def get_perm_cases_metrics(conn, latest_date: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Get PERM cases metrics for dashboard integration with both activity views.
+    
+    Args:
+        conn: Database connection
+        latest_date: Latest date with data, looked up when not given
+    """
     try:
-        # Get the latest date with data (same pattern as other functions)
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            cursor.execute("""
-                SELECT MAX(record_date) as latest_date
-                FROM summary_stats
-            """)
-            latest_row = cursor.fetchone()
-            latest_date = latest_row['latest_date'] if latest_row and latest_row['latest_date'] else date.today()
-        
-        # Query 1: Activity data for the latest date with updates
-        daily_activity_data = get_perm_cases_activity_data(conn)
+        if latest_date is None:
+            latest_date = get_latest_record_date(conn)
         
-        # Query 2: All employer letters from the latest active month
-        latest_month_data = get_perm_cases_latest_month_data(conn)
+        # Activity data for the latest date with updates, and all employer letters
+        # from the featured month
+        daily_activity_data, latest_month_data = get_perm_cases_activity_rows(conn, latest_date)
         
         # Calculate summary metrics for daily activity
         daily_most_active_letter = None
@@ -1362,9 +1479,7 @@ def get_perm_cases_metrics(conn) -> Dict[str, Any]:
             }
         }
     except Exception as e:
-        print(f"Error in get_perm_cases_metrics: {str(e)}")
-        import traceback
-        print(traceback.format_exc())
+        log_query_error("get_perm_cases_metrics", e)
         # Return empty metrics on error
         return {
             "daily_activity": {
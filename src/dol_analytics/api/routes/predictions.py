@@ -1,304 +1,421 @@
+import asyncio
+import hashlib
+import logging
 from datetime import date, timedelta
-from typing import Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Dict, Any, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
 import psycopg2
 import psycopg2.extras
 from pydantic import BaseModel, Field
-import requests
-
-# Use relative imports if running as a module
-try:
-    from ...models.database import get_postgres_connection
-except ImportError:
-    # Use absolute imports if running as a script
-    from src.dol_analytics.models.database import get_postgres_connection
+import httpx
 
+from ...models.database import get_postgres_connection, run_with_connection, execute_prepared, MONTH_NUM_SQL
 from ...config import get_settings
+from ...services.cache import TTLCache
+from ...services.serialization import ORJSONResponse
 
 settings = get_settings()
+logger = logging.getLogger("dol_analytics.predictions")
 
 router = APIRouter(prefix="/predictions", tags=["predictions"])
 
+# reCAPTCHA tokens Google has already accepted, keyed by the first 16 bytes of the
+# SHA-256 digest of the client IP and token, with the uses each has left.
+# Google only accepts a token once, so this lets the autocomplete reuse one across
+# a few keystrokes. The trade-off: a solved captcha buys its client up to
+# RECAPTCHA_TOKEN_MAX_USES company requests within two minutes instead of one,
+# still subject to the rate limits. Other clients can't replay it.
+RECAPTCHA_TOKEN_TTL = 120
+RECAPTCHA_TOKEN_MAX_USES = 5
+verified_recaptcha_tokens = TTLCache(ttl=RECAPTCHA_TOKEN_TTL, maxsize=10000)
+
+# Shared HTTP client for reCAPTCHA verification, so connections to Google are reused
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(base_url="https://www.google.com", timeout=2.0)
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client (application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 # Update request model to include employer first letter and case number
 class DateSubmissionRequest(BaseModel):
     submit_date: date
     employer_first_letter: str = Field(..., min_length=1, max_length=1, description="First letter of employer name (A-Z)")
     case_number: Optional[str] = Field(None, description="Case number for the application (optional)")
 
-@router.post("/from-date")
-async def predict_from_submit_date(
-    request: DateSubmissionRequest,
-    conn=Depends(get_postgres_connection)
-):
+
+def letter_factors(letter_position: int) -> Tuple[str, str, float, float]:
     """
-    Predict completion date for a case submitted on a specific date,
-    factoring in current processing rates, queue position, and employer name.
+    Get how an employer name's first letter (A=0, Z=25) affects processing.
+    
+    Returns:
+        Priority (HIGH, MEDIUM or LOW), processing impact (FASTER, AVERAGE or
+        SLOWER), position within the month (0.0 for 'A', 1.0 for 'Z') and days
+        faster/slower than the middle of the alphabet
     """
-    submit_date = request.submit_date
-    employer_letter = request.employer_first_letter.upper()
-    case_number = request.case_number or f"ANON-{submit_date.isoformat()}-{employer_letter}"
-    today = date.today()
+    letter_percentage = letter_position / 25.0
+    letter_priority = "HIGH" if letter_position < 9 else "MEDIUM" if letter_position < 18 else "LOW"
+    letter_impact = "FASTER" if letter_position < 9 else "AVERAGE" if letter_position < 18 else "SLOWER"
+    return letter_priority, letter_impact, letter_percentage, round((letter_percentage - 0.5) * 160, 0)
+
+
+# letter_factors for A-Z, computed once
+LETTER_FACTORS = {chr(ord('A') + i): letter_factors(i) for i in range(26)}
+
+# Upper bound estimates allow 15% more time than the estimate
+UPPER_BOUND_FACTOR = 1.15
+
+
+# Latest processing times, backlog and weekly rate change at most daily, so every
+# /from-date request within PREDICTION_BASELINE_TIMEOUT reuses one read, keyed by date
+PREDICTION_BASELINE_TIMEOUT = 300  # 5 minutes in seconds
+prediction_baseline_cache = TTLCache(ttl=PREDICTION_BASELINE_TIMEOUT, maxsize=4)
+
+
+def get_prediction_baseline(conn, today: date) -> Dict[str, Any]:
+    """
+    Get the inputs of the estimate that don't depend on the submit date.
     
-    try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # First, ensure the prediction_requests table exists
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS prediction_requests (
-                    id SERIAL PRIMARY KEY,
-                    submit_date DATE NOT NULL,
-                    employer_first_letter CHAR(1) NOT NULL,
-                    case_number VARCHAR(255),
-                    request_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    estimated_completion_date DATE,
-                    estimated_days INTEGER,
-                    confidence_level DECIMAL(3,2),
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Store the prediction request
-            cursor.execute("""
-                INSERT INTO prediction_requests (
-                    submit_date, employer_first_letter, case_number, request_timestamp
-                ) VALUES (%s, %s, %s, %s)
-                RETURNING id
-            """, (submit_date, employer_letter, request.case_number, today))
-            
-            request_id = cursor.fetchone()['id']
-            # 1. Get base processing time metrics
-            cursor.execute("""
+    Runs a blocking query, so the route calls it in the threadpool.
+    """
+    # Get the current week's start date
+    current_week_start = today - timedelta(days=today.weekday())
+    
+    with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
+        # pt: base processing time metrics
+        # ss: current backlog (cases ahead in queue)
+        # ws: average weekly processing from weekly_summary, filtering out abnormal weeks
+        #     (data gaps, partial weeks) with < 1500 cases. This keeps holiday weeks like
+        #     Veterans Day (~1600) but excludes true anomalies
+        cursor.execute("""
+            WITH pt AS (
                 SELECT 
+                    true as found,
                     percentile_50 as median_days,
                     percentile_80 as upper_estimate_days
                 FROM processing_times
                 ORDER BY record_date DESC
                 LIMIT 1
-            """)
-            processing_row = cursor.fetchone()
-            
-            if not processing_row:
-                raise HTTPException(status_code=404, detail="No processing time data available")
-                
-            # 2. Get current backlog (cases ahead in queue)
-            cursor.execute("""
+            ),
+            ss AS (
                 SELECT pending_applications
                 FROM summary_stats
                 ORDER BY record_date DESC
                 LIMIT 1
-            """)
-            backlog_row = cursor.fetchone()
-            current_backlog = float(backlog_row['pending_applications']) if backlog_row and backlog_row['pending_applications'] else 0
-            
-            # 3. Use weekly_summary view to get weekly processing rate
-            # Get the current week's start date
-            current_week_start = today - timedelta(days=today.weekday())
-            
-            # Query weekly_summary for average weekly processing
-            # Filter out abnormal weeks (data gaps, partial weeks) by excluding weeks with < 1500 cases
-            # This keeps holiday weeks like Veterans Day (~1600) but excludes true anomalies
-            cursor.execute("""
+            ),
+            ws AS (
                 SELECT AVG(total_applications) as avg_weekly_apps
                 FROM (
                     SELECT week_start, total_applications
                     FROM weekly_summary
-                    WHERE week_start < %s  -- Exclude current incomplete week
+                    WHERE week_start < %(current_week_start)s  -- Exclude current incomplete week
                         AND total_applications >= 1500  -- Exclude data gaps/partial weeks
                     ORDER BY week_start DESC
                     LIMIT 4
                 ) as recent_weeks
-            """, (current_week_start,))
-            
-            # Get result and apply fallback if needed
-            weekly_row = cursor.fetchone()
-            weekly_rate = float(weekly_row['avg_weekly_apps']) if weekly_row and weekly_row['avg_weekly_apps'] else 2900
-            
-            # 4. Basic processing times
-            base_days = float(processing_row['median_days']) if processing_row and processing_row['median_days'] else 150
-            upper_base_days = float(processing_row['upper_estimate_days']) if processing_row and processing_row['upper_estimate_days'] else 300
-            
-            # 5. Calculate queue position from monthly_status table
-            days_in_queue = max(0, (today - submit_date).days)
-
-            # Get the month and year from the submit date
-            submit_month_name = submit_date.strftime("%B")
-            submit_year = submit_date.year
-
-            # Create a mapping of month names to numbers
-            month_to_num = {
-                "January": 1, "February": 2, "March": 3, "April": 4,
-                "May": 5, "June": 6, "July": 7, "August": 8,
-                "September": 9, "October": 10, "November": 11, "December": 12
-            }
+            )
+            SELECT
+                pt.found as processing_found,
+                pt.median_days,
+                pt.upper_estimate_days,
+                ss.pending_applications,
+                ws.avg_weekly_apps
+            FROM ws
+            LEFT JOIN pt ON true
+            LEFT JOIN ss ON true
+        """, {"current_week_start": current_week_start})
+        return dict(cursor.fetchone())
 
-            # Get numeric value of the submission month
-            submit_month_num = month_to_num.get(submit_month_name, 0)
 
-            # Sum all ANALYST REVIEW cases from months BEFORE the submit month
-            cursor.execute("""
+def predict_completion(conn, request: DateSubmissionRequest, baseline: Dict[str, Any], today: date) -> Dict[str, Any]:
+    """
+    Compute the estimated completion date for a request and store both.
+    
+    Args:
+        conn: Database connection
+        request: The submitted date, employer letter and case number
+        baseline: Inputs from get_prediction_baseline
+        today: The date the baseline was read for
+    
+    Runs blocking queries, so the route calls it in the threadpool.
+    """
+    submit_date = request.submit_date
+    employer_letter = request.employer_first_letter.upper()
+    
+    if not baseline['processing_found']:
+        raise HTTPException(status_code=404, detail="No processing time data available")
+    
+    with conn.cursor() as cursor:
+        # Get the month and year from the submit date
+        submit_year = submit_date.year
+        submit_month_num = submit_date.month
+        
+        # Read the queue position in one round-trip:
+        # ms_before: all ANALYST REVIEW cases from months BEFORE the submit month
+        # ms_same: the submit month itself, where day of month is less relevant than employer letter
+        execute_prepared(cursor, "prediction_queue_position", f"""
+            WITH ms_before AS (
                 SELECT SUM(count) as cases_ahead
                 FROM monthly_status
                 WHERE status = 'ANALYST REVIEW'
-                AND (
-                    (year < %s) OR 
-                    (year = %s AND 
-                        CASE
-                            WHEN month = 'January' THEN 1
-                            WHEN month = 'February' THEN 2
-                            WHEN month = 'March' THEN 3
-                            WHEN month = 'April' THEN 4
-                            WHEN month = 'May' THEN 5
-                            WHEN month = 'June' THEN 6
-                            WHEN month = 'July' THEN 7
-                            WHEN month = 'August' THEN 8
-                            WHEN month = 'September' THEN 9
-                            WHEN month = 'October' THEN 10
-                            WHEN month = 'November' THEN 11
-                            WHEN month = 'December' THEN 12
-                        END < %s
-                    )
-                )
-            """, (submit_year, submit_year, submit_month_num))
-
-            row = cursor.fetchone()
-            cases_before_month = float(row['cases_ahead']) if row and row['cases_ahead'] else 0
-
-            # For the submit month itself, day of month is less relevant than employer letter
-            cursor.execute("""
+                AND (year, {MONTH_NUM_SQL}) < ($1, $2)
+            ),
+            ms_same AS (
                 SELECT count
                 FROM monthly_status
                 WHERE status = 'ANALYST REVIEW'
-                AND year = %s AND month = %s
-            """, (submit_year, submit_month_name))
+                AND year = $1 AND {MONTH_NUM_SQL} = $2
+                LIMIT 1
+            )
+            SELECT
+                ms_before.cases_ahead,
+                ms_same.count as same_month_count
+            FROM ms_before
+            LEFT JOIN ms_same ON true
+        """, (submit_year, submit_month_num))
+        cases_ahead, same_month_count = cursor.fetchone()
+        
+        current_backlog = float(baseline['pending_applications']) if baseline['pending_applications'] else 0
+        
+        # Apply fallback if needed
+        weekly_rate = float(baseline['avg_weekly_apps']) if baseline['avg_weekly_apps'] else 2900
+        
+        # Basic processing times
+        base_days = float(baseline['median_days']) if baseline['median_days'] else 150
+        upper_base_days = float(baseline['upper_estimate_days']) if baseline['upper_estimate_days'] else 300
+        
+        # Calculate queue position from monthly_status
+        days_in_queue = max(0, (today - submit_date).days)
+        cases_before_month = float(cases_ahead) if cases_ahead else 0
+        same_month_total = float(same_month_count) if same_month_count else 0
 
-            same_month_row = cursor.fetchone()
-            same_month_total = float(same_month_row['count']) if same_month_row and same_month_row['count'] else 0
+        # Calculate position within the same month based primarily on letter
+        # Employers with names earlier in alphabet get processed earlier
+        letter_priority, letter_impact, letter_percentage, letter_impact_days = (
+            LETTER_FACTORS.get(employer_letter) or letter_factors(ord(employer_letter) - ord('A'))
+        )
 
-            # Determine letter position (A=0, Z=25)
-            letter_position = ord(employer_letter) - ord('A')
+        # The day of month has a minor effect compared to employer letter (20% day, 80% letter)
+        day_percentage = (submit_date.day - 1) / 30.0  # 0.0 for day 1, 1.0 for day 31
+        month_position_factor = (letter_percentage * 0.8) + (day_percentage * 0.2)
 
-            # Calculate position within the same month based primarily on letter
-            # Employers with names earlier in alphabet get processed earlier
-            letter_percentage = letter_position / 25.0  # 0.0 for 'A', 1.0 for 'Z'
+        # Calculate position within month
+        same_month_cases = same_month_total * month_position_factor
 
-            # The day of month has a minor effect compared to employer letter (20% day, 80% letter)
-            day_percentage = (submit_date.day - 1) / 30.0  # 0.0 for day 1, 1.0 for day 31
-            month_position_factor = (letter_percentage * 0.8) + (day_percentage * 0.2)
+        # Calculate total queue position
+        raw_queue_position = cases_before_month + same_month_cases
 
-            # Calculate position within month
-            same_month_cases = same_month_total * month_position_factor
+        # We don't need the additional letter adjustment since we incorporated it directly
+        adjusted_queue_position = raw_queue_position
 
-            # Calculate total queue position
-            raw_queue_position = cases_before_month + same_month_cases
+        # Recalculate queue time with the position
+        queue_weeks = adjusted_queue_position / weekly_rate if weekly_rate > 0 else 0
+        queue_days = int(queue_weeks * 7)
+        
+        # Rest of calculations using the adjusted queue_days
+        remaining_days = queue_days
+        total_journey_days = days_in_queue + remaining_days
+        
+        # Calculate completion date based on today + adjusted queue time
+        estimated_completion_date = today + timedelta(days=remaining_days)
+        upper_remaining_days = int(remaining_days * UPPER_BOUND_FACTOR)
+        upper_total_days = int(total_journey_days * UPPER_BOUND_FACTOR)
+        upper_bound_date = today + timedelta(days=upper_remaining_days)
 
-            # We don't need the additional letter adjustment since we incorporated it directly
-            adjusted_queue_position = raw_queue_position
+        # Store the prediction request with its calculated results
+        execute_prepared(cursor, "prediction_insert", """
+            INSERT INTO prediction_requests (
+                submit_date, employer_first_letter, case_number,
+                estimated_completion_date, estimated_days, confidence_level
+            ) VALUES ($1, $2, $3, $4, $5, $6)
+            RETURNING id
+        """, (
+            submit_date, employer_letter, request.case_number,
+            estimated_completion_date, total_journey_days, 0.8,
+        ))
+        (request_id,) = cursor.fetchone()
+        
+        # Include letter information and case number in response
+        return {
+            "request_id": request_id,
+            "submit_date": submit_date,
+            "employer_first_letter": employer_letter,
+            "case_number": request.case_number,  # Return the original case_number (could be None)
+            "estimated_completion_date": estimated_completion_date,
+            "upper_bound_date": upper_bound_date,
+            "estimated_days": total_journey_days,
+            "remaining_days": remaining_days,
+            "upper_bound_days": upper_total_days,
+            "queue_analysis": {
+                "current_backlog": int(current_backlog),
+                "raw_queue_position": int(raw_queue_position),
+                "adjusted_queue_position": int(adjusted_queue_position),
+                "weekly_processing_rate": int(weekly_rate),
+                "daily_processing_rate": int(weekly_rate / 7),
+                "estimated_queue_wait_weeks": round(queue_weeks, 1),
+                "days_already_in_queue": days_in_queue,
+                "employer_letter_impact": letter_impact_days  # days faster/slower vs middle of alphabet
+            },
+            "factors_considered": {
+                "queue_time": queue_days,
+                "days_remaining": remaining_days,
+                "total_journey_days": total_journey_days,
+                "employer_name_letter": employer_letter,
+                "letter_priority": letter_priority,  # HIGH, MEDIUM, or LOW
+                "processing_impact": letter_impact   # FASTER, AVERAGE, or SLOWER
+            },
+            "confidence_level": 0.8
+        }
 
-            # Recalculate queue time with the position
-            queue_weeks = adjusted_queue_position / weekly_rate if weekly_rate > 0 else 0
-            queue_days = int(queue_weeks * 7)
-            
-            # Rest of calculations using the adjusted queue_days
-            remaining_days = queue_days
-            total_journey_days = days_in_queue + remaining_days
-            
-            # Calculate completion date based on today + adjusted queue time
-            estimated_completion_date = today + timedelta(days=remaining_days)
-            upper_bound_date = today + timedelta(days=int(remaining_days * 1.15))
-            
-            # Define letter priority categories
-            letter_priority = "HIGH" if letter_position < 9 else "MEDIUM" if letter_position < 18 else "LOW"
-            letter_impact = "FASTER" if letter_position < 9 else "AVERAGE" if letter_position < 18 else "SLOWER"
-
-            # Update the stored prediction with calculated results
-            cursor.execute("""
-                UPDATE prediction_requests 
-                SET estimated_completion_date = %s, 
-                    estimated_days = %s, 
-                    confidence_level = %s
-                WHERE id = %s
-            """, (estimated_completion_date, total_journey_days, 0.8, request_id))
-            
-            # Include letter information and case number in response
-            return {
-                "request_id": request_id,
-                "submit_date": submit_date.isoformat(),
-                "employer_first_letter": employer_letter,
-                "case_number": request.case_number,  # Return the original case_number (could be None)
-                "estimated_completion_date": estimated_completion_date.isoformat(),
-                "upper_bound_date": upper_bound_date.isoformat(),
-                "estimated_days": total_journey_days,
-                "remaining_days": remaining_days,
-                "upper_bound_days": int(total_journey_days * 1.15),
-                "queue_analysis": {
-                    "current_backlog": int(current_backlog),
-                    "raw_queue_position": int(raw_queue_position),
-                    "adjusted_queue_position": int(adjusted_queue_position),
-                    "weekly_processing_rate": int(weekly_rate),
-                    "daily_processing_rate": int(weekly_rate / 7),
-                    "estimated_queue_wait_weeks": round(queue_weeks, 1),
-                    "days_already_in_queue": days_in_queue,
-                    "employer_letter_impact": round((letter_percentage - 0.5) * 160, 0)  # days faster/slower vs middle of alphabet
-                },
-                "factors_considered": {
-                    "queue_time": queue_days,
-                    "days_remaining": remaining_days,
-                    "total_journey_days": total_journey_days,
-                    "employer_name_letter": employer_letter,
-                    "letter_priority": letter_priority,  # HIGH, MEDIUM, or LOW
-                    "processing_impact": letter_impact   # FASTER, AVERAGE, or SLOWER
-                },
-                "confidence_level": 0.8
-            }
-            
+
+@router.post("/from-date", response_class=ORJSONResponse)
+async def predict_from_submit_date(
+    request: DateSubmissionRequest,
+    conn=Depends(get_postgres_connection)
+):
+    """
+    Predict completion date for a case submitted on a specific date,
+    factoring in current processing rates, queue position, and employer name.
+    """
+    try:
+        today = date.today()
+        baseline = await prediction_baseline_cache.get_or_set(
+            today, lambda: run_in_threadpool(get_prediction_baseline, conn, today)
+        )
+        prediction = await run_in_threadpool(predict_completion, conn, request, baseline, today)
+        # Rendered straight from the dict, without FastAPI's jsonable_encoder pass
+        return ORJSONResponse(prediction)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error predicting completion date: {str(e)}")
 
-@router.get("/requests")
+PREDICTION_REQUEST_COLUMNS = """
+    id,
+    submit_date,
+    employer_first_letter,
+    case_number,
+    request_timestamp,
+    estimated_completion_date,
+    estimated_days,
+    confidence_level,
+    created_at
+"""
+
+
+# Planner estimate of the number of stored prediction requests. Expired estimates are
+# still served for up to another hour while a background task reads it again.
+PREDICTION_COUNT_TIMEOUT = 60  # 1 minute in seconds
+prediction_count_cache = TTLCache(ttl=PREDICTION_COUNT_TIMEOUT, maxsize=1, stale_ttl=3600)
+
+
+def estimate_prediction_requests(conn) -> int:
+    """
+    Estimate the number of stored prediction requests from the planner statistics.
+    
+    Falls back to an exact count while the table has never been analyzed.
+    """
+    with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
+        cursor.execute("""
+            SELECT reltuples::bigint as total
+            FROM pg_class
+            WHERE relname = 'prediction_requests'
+        """)
+        row = cursor.fetchone()
+        if row and row['total'] >= 0:
+            return row['total']
+        
+        cursor.execute("SELECT COUNT(*) as total FROM prediction_requests")
+        return cursor.fetchone()['total']
+
+
+def get_prediction_requests_page(conn, limit: int, offset: int = 0, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Get one page of stored prediction requests, newest first.
+    
+    Pages after the first are read below after_id when it is given, and at
+    offset otherwise. Ids follow insertion order, like created_at.
+    """
+    with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
+        if after_id is None:
+            execute_prepared(cursor, "prediction_requests_page", f"""
+                SELECT {PREDICTION_REQUEST_COLUMNS}
+                FROM prediction_requests
+                ORDER BY id DESC
+                LIMIT $1 OFFSET $2
+            """, (limit, offset))
+        else:
+            execute_prepared(cursor, "prediction_requests_after", f"""
+                SELECT {PREDICTION_REQUEST_COLUMNS}
+                FROM prediction_requests
+                WHERE id < $1
+                ORDER BY id DESC
+                LIMIT $2
+            """, (after_id, limit))
+        
+        return [dict(row) for row in cursor.fetchall()]
+
+
+def get_prediction_request_row(conn, request_id: int) -> Optional[Dict[str, Any]]:
+    """Get a stored prediction request by ID, or None if there is none."""
+    with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
+        execute_prepared(cursor, "prediction_request_by_id", f"""
+            SELECT {PREDICTION_REQUEST_COLUMNS}
+            FROM prediction_requests
+            WHERE id = $1
+        """, (request_id,))
+        
+        request = cursor.fetchone()
+        return dict(request) if request else None
+
+
+@router.get("/requests", response_class=ORJSONResponse)
 async def get_prediction_requests(
-    limit: int = 100,
-    offset: int = 0,
+    limit: int = Query(100, ge=1, le=1000, description="Number of requests per page"),
+    offset: int = Query(0, ge=0, description="Offset for pagination (ignored when after_id is set)"),
+    after_id: Optional[int] = Query(None, description="next_after_id from the previous page, for keyset pagination"),
     conn=Depends(get_postgres_connection)
 ):
     """
-    Get stored prediction requests with pagination.
+    Get stored prediction requests, newest first.
+    
+    Pass a page's next_after_id as after_id to get the following page.
+    total is kept for older clients and holds the same estimate as
+    estimated_total.
     """
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            # Get total count
-            cursor.execute("SELECT COUNT(*) as total FROM prediction_requests")
-            total_count = cursor.fetchone()['total']
-            
-            # Get paginated results
-            cursor.execute("""
-                SELECT 
-                    id,
-                    submit_date,
-                    employer_first_letter,
-                    case_number,
-                    request_timestamp,
-                    estimated_completion_date,
-                    estimated_days,
-                    confidence_level,
-                    created_at
-                FROM prediction_requests
-                ORDER BY created_at DESC
-                LIMIT %s OFFSET %s
-            """, (limit, offset))
-            
-            requests = cursor.fetchall()
-            
-            return {
-                "total": total_count,
-                "limit": limit,
-                "offset": offset,
-                "requests": [dict(row) for row in requests]
-            }
-            
+        # The estimate reads on its own connection, so both queries run at once
+        estimated_total, requests = await asyncio.gather(
+            prediction_count_cache.get_or_set(
+                "total", lambda: run_in_threadpool(run_with_connection, estimate_prediction_requests)
+            ),
+            run_in_threadpool(get_prediction_requests_page, conn, limit, offset, after_id),
+        )
+        
+        return ORJSONResponse({
+            "total": estimated_total,
+            "estimated_total": estimated_total,
+            "limit": limit,
+            "offset": offset,
+            "after_id": after_id,
+            "next_after_id": requests[-1]["id"] if requests and len(requests) == limit else None,
+            "requests": requests
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving prediction requests: {str(e)}")
 
 
-@router.get("/requests/{request_id}")
+@router.get("/requests/{request_id}", response_class=ORJSONResponse)
 async def get_prediction_request(
     request_id: int,
     conn=Depends(get_postgres_connection)
@@ -307,51 +424,41 @@ async def get_prediction_request(
     Get a specific prediction request by ID.
     """
     try:
-        with conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-            cursor.execute("""
-                SELECT 
-                    id,
-                    submit_date,
-                    employer_first_letter,
-                    case_number,
-                    request_timestamp,
-                    estimated_completion_date,
-                    estimated_days,
-                    confidence_level,
-                    created_at
-                FROM prediction_requests
-                WHERE id = %s
-            """, (request_id,))
-            
-            request = cursor.fetchone()
-            
-            if not request:
-                raise HTTPException(status_code=404, detail="Prediction request not found")
-            
-            return dict(request)
-            
-    except HTTPException:
-        raise
+        request = await run_in_threadpool(get_prediction_request_row, conn, request_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving prediction request: {str(e)}")
+    
+    if not request:
+        raise HTTPException(status_code=404, detail="Prediction request not found")
+    
+    return ORJSONResponse(request)
 
 
-def verify_recaptcha(token: str) -> bool:
-    """Verify reCAPTCHA token with Google's API."""
+async def verify_recaptcha(token: str, client_ip: str) -> bool:
+    """Verify reCAPTCHA token with Google's API, for the client that sent it."""
     try:
         # Skip verification in development mode if configured
         if settings.DEBUG and settings.SKIP_RECAPTCHA_IN_DEBUG:
-            print("DEBUG mode: Skipping reCAPTCHA verification")
+            logger.debug("DEBUG mode: Skipping reCAPTCHA verification")
             return True
             
         recaptcha_secret = settings.RECAPTCHA_SECRET_KEY
         if not recaptcha_secret:
-            print("WARNING: reCAPTCHA secret key not configured, skipping verification")
+            logger.warning("reCAPTCHA secret key not configured, skipping verification")
+            return True
+        
+        # Accept tokens this client had verified recently, while they have uses left
+        token_hash = hashlib.sha256(f"{client_ip}\0{token}".encode()).digest()[:16]
+        uses_left = verified_recaptcha_tokens.get(token_hash)
+        if uses_left is not None:
+            if uses_left[0] <= 0:
+                return False
+            uses_left[0] -= 1
             return True
             
         # Make request to Google's verification API
-        response = requests.post(
-            "https://www.google.com/recaptcha/api/siteverify",
+        response = await get_http_client().post(
+            "/recaptcha/api/siteverify",
             data={
                 "secret": recaptcha_secret,
                 "response": token
@@ -359,12 +466,15 @@ def verify_recaptcha(token: str) -> bool:
         )
         result = response.json()
         
-        # Log result for debugging
-        print(f"reCAPTCHA verification result: {result}")
-        
         # Return True if successful, False otherwise
-        return result.get("success", False)
+        success = result.get("success", False)
+        if not success:
+            logger.info("reCAPTCHA verification failed: %s", result.get("error-codes"))
+        else:
+            # This request is the token's first use
+            verified_recaptcha_tokens.set(token_hash, [RECAPTCHA_TOKEN_MAX_USES - 1])
+        return success
     except Exception as e:
-        print(f"Error verifying reCAPTCHA: {str(e)}")
+        logger.error("Error verifying reCAPTCHA: %s", e)
         # In case of error, default to rejecting the request for security
         return False
@@ -1,11 +1,6 @@
-import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import ConfigDict
 from functools import lru_cache
-from dotenv import load_dotenv
-
-# Explicitly load .env file from project root
-load_dotenv()
 
 
 class Settings(BaseSettings):
@@ -18,6 +13,8 @@ class Settings(BaseSettings):
     
     # PostgreSQL configuration for the external data service
     POSTGRES_DATABASE_URL: str
+    DB_STATEMENT_TIMEOUT_MS: int = 10000  # Per-statement limit for API queries (0 disables)
+    DB_POOL_SIZE: int = 10  # Most pooled connections kept open to the database
     
     # reCAPTCHA configuration
     RECAPTCHA_SECRET_KEY: str = ""
@@ -26,7 +23,12 @@ class Settings(BaseSettings):
     # OpenAI configuration
     OPENAI_API_KEY: str = ""
     
-    # Specify exactly where to look for the .env file
+    # Dashboard configuration (the submission month featured in PERM activity)
+    FEATURED_SUBMIT_YEAR: int = 2024
+    FEATURED_SUBMIT_MONTH: int = 10
+    
+    # Specify exactly where to look for the .env file (read once, when
+    # get_settings() first builds the settings; nothing reads os.environ directly)
     model_config = ConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
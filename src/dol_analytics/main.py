@@ -1,10 +1,15 @@
+import asyncio
 import logging
+import logging.handlers
+import queue
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 
 from src.dol_analytics.config import get_settings
 from src.dol_analytics.api.routes import data, predictions, chatbot
+from src.dol_analytics.models.database import close_connection_pool, ensure_schema
 
 settings = get_settings()
 
@@ -15,22 +20,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger("dol_analytics")
 
+# Hand records to a background thread so request handlers never block on log I/O
+log_queue = queue.SimpleQueue()
+root_logger = logging.getLogger()
+log_listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+
+
+async def prepare_database():
+    """Apply the schema statements, then warm the dashboard cache."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, ensure_schema)
+    await data.warm_dashboard_cache()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifecycle events for the FastAPI application.
-    - Initialize database
+    - Initialize database (create missing indexes)
+    - Warm the dashboard cache
+    - Close the PostgreSQL connection pool and HTTP client on shutdown
     """
-    # Initialize database tables for local SQLAlchemy models
-    # (though we'll be primarily using the external PostgreSQL database)
+    log_listener.start()
+    
+    # Create any missing tables and indexes, then precompute the common dashboard
+    # periods, in the background so startup isn't delayed (index builds can take
+    # a while). Warming waits for the schema so it never caches results from
+    # queries that ran against a half-initialized database.
     logger.info("Initializing database")
+    warm_task = asyncio.create_task(prepare_database())
     
     # Yield control to the application
     yield
     
-    # Cleanup (if needed)
+    # Cleanup
     logger.info("Shutting down application")
+    warm_task.cancel()
+    close_connection_pool()
+    await predictions.close_http_client()
+    log_listener.stop()
 
 
 # Create FastAPI app
@@ -65,6 +94,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (the dashboard series are highly repetitive)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API routes
 app.include_router(data.router, prefix=settings.API_PREFIX)
 app.include_router(predictions.router, prefix=settings.API_PREFIX)
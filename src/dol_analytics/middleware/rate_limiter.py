@@ -2,38 +2,50 @@
 Rate limiting middleware to prevent API abuse and scraping.
 """
 
+import math
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from fastapi import HTTPException, Request
-from collections import defaultdict, deque
+from collections import Counter, OrderedDict
 import logging
 
 logger = logging.getLogger("dol_analytics.rate_limiter")
 
+# Seconds an IP's rate limit violations are tracked from the first one
+SUSPICIOUS_WINDOW = 3600
+
 
 class RateLimiter:
     """
     Rate limiter with different limits for different endpoints.
-    Uses sliding window approach with IP-based tracking.
+    Uses sliding window counters with IP-based tracking: the request count
+    for the previous fixed window is weighted by how much of it still
+    overlaps the sliding window, so each IP needs three numbers per
+    endpoint instead of a timestamp per request. Beyond ``max_tracked_ips``
+    IPs, the least recently seen IP is forgotten.
     """
     
-    def __init__(self):
-        # Store request timestamps per IP per endpoint
-        # Structure: {ip: {endpoint: deque([timestamp1, timestamp2, ...])}}
-        self.requests: Dict[str, Dict[str, deque]] = defaultdict(lambda: defaultdict(deque))
+    def __init__(self, max_tracked_ips: int = 10000):
+        # Store window counters per IP per endpoint, least recently seen IP first
+        # Structure: {ip: {endpoint: [current_window_start, previous_count, current_count]}}
+        self.requests: "OrderedDict[str, Dict[str, List[float]]]" = OrderedDict()
+        self.max_tracked_ips = max_tracked_ips
         
         # Rate limits per endpoint (requests per time window)
-        # Only apply to company search endpoints
+        # Apply to company search endpoints and the dashboard (uncached periods are expensive)
         self.limits = {
             "/api/data/company-search": {"requests": 10, "window": 60},  # 10 requests per minute
             "/api/data/company-cases": {"requests": 5, "window": 60},    # 5 requests per minute
+            "/api/data/dashboard": {"requests": 60, "window": 60},       # 60 requests per minute
         }
         
         # Global rate limit (fallback for any endpoint)
         self.global_limit = {"requests": 100, "window": 60}  # 100 requests per minute
         
-        # Suspicious activity tracking
-        self.suspicious_ips: Dict[str, Dict] = {}  # {ip: {"count": int, "first_seen": timestamp}}
+        # Suspicious activity tracking over the last hour, least recently flagged IP first
+        # (bounded by max_tracked_ips like the counters)
+        # Structure: {ip: {"count": int, "first_seen": timestamp, "endpoints": Counter}}
+        self.suspicious_ips: "OrderedDict[str, Dict]" = OrderedDict()
         
     def get_client_ip(self, request: Request) -> str:
         """Extract client IP from request, handling proxies."""
@@ -50,15 +62,42 @@ class RateLimiter:
         # Fallback to direct client IP
         return request.client.host if request.client else "unknown"
     
-    def clean_old_requests(self, ip: str, endpoint: str, window: int):
-        """Remove requests older than the time window."""
-        current_time = time.time()
-        cutoff_time = current_time - window
+    def get_window_counter(self, ip: str, endpoint: str, window: int, current_time: float) -> List[float]:
+        """Get the counter for an IP and endpoint, rolled forward to the current window."""
+        window_start = current_time - current_time % window
+        ip_counters = self.requests.get(ip)
+        
+        if ip_counters is None:
+            ip_counters = self.requests[ip] = {}
+            while len(self.requests) > self.max_tracked_ips:
+                self.requests.popitem(last=False)
+        else:
+            self.requests.move_to_end(ip)
+        
+        counter = ip_counters.get(endpoint)
+        if counter is None:
+            counter = ip_counters[endpoint] = [window_start, 0, 0]
+        elif counter[0] != window_start:
+            # The old current window becomes the previous one if it is adjacent,
+            # otherwise both windows are empty
+            previous_count = counter[2] if window_start - counter[0] == window else 0
+            counter[:] = [window_start, previous_count, 0]
+        
+        return counter
+    
+    @staticmethod
+    def get_retry_after(counter: List[float], max_requests: int, window: int, current_time: float) -> int:
+        """Seconds until the weighted request count drops below the limit."""
+        window_start, previous_count, current_count = counter
+        elapsed = current_time - window_start
+        
+        if current_count >= max_requests:
+            # Wait for the next window, then for this window's share of it to decay
+            wait = (window - elapsed) + window * (1 - max_requests / current_count)
+        else:
+            wait = window * (1 - (max_requests - current_count) / previous_count) - elapsed
         
-        # Remove old requests
-        while (self.requests[ip][endpoint] and 
-               self.requests[ip][endpoint][0] < cutoff_time):
-            self.requests[ip][endpoint].popleft()
+        return max(1, math.ceil(wait))
     
     def is_rate_limited(self, request: Request) -> Optional[Dict]:
         """
@@ -67,7 +106,7 @@ class RateLimiter:
         """
         ip = self.get_client_ip(request)
         endpoint = request.url.path
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Only apply rate limiting to endpoints in the limits dictionary
         if endpoint not in self.limits:
@@ -78,11 +117,12 @@ class RateLimiter:
         max_requests = limit_config["requests"]
         window = limit_config["window"]
         
-        # Clean old requests
-        self.clean_old_requests(ip, endpoint, window)
+        counter = self.get_window_counter(ip, endpoint, window, current_time)
+        window_start, previous_count, current_count = counter
         
-        # Count current requests in window
-        current_requests = len(self.requests[ip][endpoint])
+        # Estimate requests in the sliding window from the two fixed windows
+        overlap = 1 - (current_time - window_start) / window
+        current_requests = int(current_count + previous_count * overlap)
         
         # Check if limit exceeded
         if current_requests >= max_requests:
@@ -90,11 +130,7 @@ class RateLimiter:
             self.track_suspicious_activity(ip, endpoint, current_requests, max_requests)
             
             # Calculate when they can try again
-            if self.requests[ip][endpoint]:
-                oldest_request = self.requests[ip][endpoint][0]
-                retry_after = int(oldest_request + window - current_time) + 1
-            else:
-                retry_after = window
+            retry_after = self.get_retry_after(counter, max_requests, window, current_time)
             
             logger.warning(f"Rate limit exceeded for IP {ip} on {endpoint}: {current_requests}/{max_requests}")
             
@@ -107,28 +143,29 @@ class RateLimiter:
             }
         
         # Add current request to tracking
-        self.requests[ip][endpoint].append(current_time)
+        counter[2] += 1
         
         return None
     
     def track_suspicious_activity(self, ip: str, endpoint: str, current: int, limit: int):
         """Track IPs that consistently hit rate limits."""
-        if ip not in self.suspicious_ips:
-            self.suspicious_ips[ip] = {
-                "count": 1,
-                "first_seen": time.time(),
-                "endpoints": {endpoint: 1}
-            }
-        else:
-            self.suspicious_ips[ip]["count"] += 1
-            if endpoint not in self.suspicious_ips[ip]["endpoints"]:
-                self.suspicious_ips[ip]["endpoints"][endpoint] = 0
-            self.suspicious_ips[ip]["endpoints"][endpoint] += 1
+        current_time = time.time()
+        entry = self.suspicious_ips.get(ip)
+        
+        # Start over for IPs first flagged more than an hour ago
+        if entry is None or current_time - entry["first_seen"] >= SUSPICIOUS_WINDOW:
+            entry = self.suspicious_ips[ip] = {"count": 0, "first_seen": current_time, "endpoints": Counter()}
+            while len(self.suspicious_ips) > self.max_tracked_ips:
+                self.suspicious_ips.popitem(last=False)
+        self.suspicious_ips.move_to_end(ip)
+        
+        entry["count"] += 1
+        entry["endpoints"][endpoint] += 1
         
         # Log if this IP is being very aggressive
-        if self.suspicious_ips[ip]["count"] > 10:
-            logger.error(f"SUSPICIOUS ACTIVITY: IP {ip} has hit rate limits {self.suspicious_ips[ip]['count']} times")
-            logger.error(f"Endpoints targeted: {self.suspicious_ips[ip]['endpoints']}")
+        if entry["count"] > 10:
+            logger.error(f"SUSPICIOUS ACTIVITY: IP {ip} has hit rate limits {entry['count']} times")
+            logger.error(f"Endpoints targeted: {dict(entry['endpoints'])}")
     
     def get_suspicious_ips(self) -> Dict:
         """Get list of suspicious IPs for monitoring."""
@@ -137,7 +174,7 @@ class RateLimiter:
         
         for ip, data in self.suspicious_ips.items():
             # Only include IPs that have been suspicious in the last hour
-            if current_time - data["first_seen"] < 3600:
+            if current_time - data["first_seen"] < SUSPICIOUS_WINDOW:
                 recent_suspicious[ip] = data
         
         return recent_suspicious
@@ -146,11 +183,12 @@ class RateLimiter:
         """Temporarily block an IP (duration in seconds)."""
         # This could be extended to use a more persistent storage
         # For now, we'll just add a very high request count
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Add many fake requests to effectively block the IP
-        for endpoint in self.limits.keys():
-            self.requests[ip][endpoint] = deque([current_time] * 1000)
+        for endpoint, limit_config in self.limits.items():
+            counter = self.get_window_counter(ip, endpoint, limit_config["window"], current_time)
+            counter[2] = 1000
         
         logger.warning(f"IP {ip} has been temporarily blocked for {duration} seconds")
 
@@ -4,14 +4,20 @@ Database connection management for DOL Analytics.
 This module provides connection handling for the PostgreSQL database
 that stores DOL application processing data and statistics.
 """
+import logging
 import os
+import re
+import weakref
+from contextlib import contextmanager
 from typing import Dict, Any, Optional
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 
 from src.dol_analytics.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger("dol_analytics.database")
 
 # PostgreSQL connection for the database
 try:
@@ -22,54 +28,326 @@ except ImportError:
     # Fall back to environment variable
     POSTGRES_CONNECTION_STRING = settings.POSTGRES_DATABASE_URL
 
+# Session settings for API connections: cap how long one statement can run,
+# so a degraded query fails fast instead of holding a worker thread, and don't
+# wait for the WAL flush on commit. The API only writes prediction_requests,
+# where a crash losing the last few requests is acceptable.
+CONNECTION_OPTIONS = (
+    f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS} "
+    "-c synchronous_commit=off"
+)
 
-def get_postgres_connection():
-    """Dependency for PostgreSQL connection to the database."""
-    # Log the connection string (sanitized for passwords)
+# Pool of warm connections shared by all requests (created on first use)
+_connection_pool = None
+
+# Names of the statements already prepared on each pooled connection
+_prepared_statements = weakref.WeakKeyDictionary()
+
+
+def get_connection_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """Get the shared PostgreSQL connection pool, creating it if needed."""
+    global _connection_pool
+    if _connection_pool is None:
+        logger.info("Connecting to PostgreSQL with: %s", sanitized_connection_string())
+        _connection_pool = psycopg2.pool.ThreadedConnectionPool(
+            1, settings.DB_POOL_SIZE, POSTGRES_CONNECTION_STRING, options=CONNECTION_OPTIONS
+        )
+        logger.info("Created PostgreSQL connection pool (up to %s connections)", settings.DB_POOL_SIZE)
+    return _connection_pool
+
+
+def sanitized_connection_string() -> str:
+    """The connection string with its password masked, for logging."""
     conn_string = POSTGRES_CONNECTION_STRING
     if ":" in conn_string and "@" in conn_string:
         # Sanitize password for logging
         parts = conn_string.split(":")
         userpass = parts[1].split("@")[0]
         conn_string = conn_string.replace(userpass, "******")
+    return conn_string
+
+
+def close_connection_pool():
+    """Close every pooled connection, e.g. when the application shuts down."""
+    global _connection_pool
+    if _connection_pool is not None:
+        _connection_pool.closeall()
+        _connection_pool = None
+        _prepared_statements.clear()
+
+
+def execute_prepared(cursor, name: str, sql: str, params: tuple = ()):
+    """
+    Execute a query as a server-side prepared statement.
+    
+    The statement is PREPAREd the first time it runs on a connection and
+    EXECUTEd by name afterwards, so Postgres parses and plans it once per
+    pooled connection instead of on every request. The SQL must use
+    $1, $2, ... placeholders.
+    """
+    prepared = _prepared_statements.setdefault(cursor.connection, set())
+    if name not in prepared:
+        cursor.execute(f"PREPARE {name} AS {sql}")
+        prepared.add(name)
     
-    print(f"Connecting to PostgreSQL with: {conn_string}")
+    if params:
+        placeholders = ", ".join(["%s"] * len(params))
+        cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+    else:
+        cursor.execute(f"EXECUTE {name}")
+
+
+def checkout_connection(pool: psycopg2.pool.ThreadedConnectionPool):
+    """
+    Take a live autocommit connection from the pool.
     
+    The server may have dropped a connection while it sat idle (a Postgres
+    restart, a proxy idle timeout) without psycopg2 noticing, so each one is
+    pinged first and replaced once with a fresh connection if that fails.
+    """
+    conn = pool.getconn()
+    try:
+        # Set autocommit to True to avoid transaction issues
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+        logger.warning("Replacing dead pooled connection: %s", e)
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
+        conn.autocommit = True
+    return conn
+
+
+def get_postgres_connection():
+    """Dependency for PostgreSQL connection to the database."""
     # Check if connection string is SQLite or empty
     if not POSTGRES_CONNECTION_STRING or POSTGRES_CONNECTION_STRING.startswith("sqlite:"):
         if settings.DEBUG:
-            print("WARNING: Using mock data instead of PostgreSQL connection.")
+            logger.warning("Using mock data instead of PostgreSQL connection")
             yield MockPostgresConnection()
             return
         else:
             raise ValueError("Invalid PostgreSQL connection string. Please set POSTGRES_DATABASE_URL in .env file.")
     
-    # Use PostgreSQL connection
+    # Use a pooled PostgreSQL connection
     try:
-        conn = psycopg2.connect(POSTGRES_CONNECTION_STRING)
-        print("Successfully connected to PostgreSQL database!")
-        
-        # Set autocommit to True to avoid transaction issues
-        conn.autocommit = True
+        pool = get_connection_pool()
+        try:
+            conn = checkout_connection(pool)
+            pooled = True
+        except psycopg2.pool.PoolError:
+            # Pool exhausted - serve this request with a one-off connection
+            conn = psycopg2.connect(POSTGRES_CONNECTION_STRING, options=CONNECTION_OPTIONS)
+            # Set autocommit to True to avoid transaction issues
+            conn.autocommit = True
+            pooled = False
         
         try:
             yield conn
         finally:
-            conn.close()
+            if pooled:
+                pool.putconn(conn, close=bool(conn.closed))
+            else:
+                conn.close()
     except Exception as e:
-        print(f"Error connecting to PostgreSQL: {str(e)}")
+        logger.error("Error connecting to PostgreSQL: %s", e)
         if settings.DEBUG:
-            print("Falling back to mock data in debug mode")
+            logger.warning("Falling back to mock data in debug mode")
             yield MockPostgresConnection()
         else:
             raise
 
 
+@contextmanager
+def postgres_connection():
+    """Context manager version of get_postgres_connection for use outside requests."""
+    yield from get_postgres_connection()
+
+
+def run_with_connection(helper, *args):
+    """
+    Run a query helper on its own pooled connection.
+    
+    Lets independent helpers run concurrently in the threadpool, and lets
+    cache refreshes outlive the request that triggered them.
+    """
+    with postgres_connection() as conn:
+        return helper(conn, *args)
+
+
+# Month number for monthly_status, whose month column holds the month name.
+# Queries must use this exact expression to match the index built on it.
+MONTH_NUM_SQL = """CASE month
+        WHEN 'January' THEN 1 WHEN 'February' THEN 2 WHEN 'March' THEN 3
+        WHEN 'April' THEN 4 WHEN 'May' THEN 5 WHEN 'June' THEN 6
+        WHEN 'July' THEN 7 WHEN 'August' THEN 8 WHEN 'September' THEN 9
+        WHEN 'October' THEN 10 WHEN 'November' THEN 11 WHEN 'December' THEN 12
+    END"""
+
+
+# Indexes the API's queries depend on, created at startup when missing.
+# CONCURRENTLY so building them never blocks writes from the ingest job.
+SCHEMA_STATEMENTS = [
+    # Stored /predictions/from-date requests (the app's only own table)
+    """
+    CREATE TABLE IF NOT EXISTS prediction_requests (
+        id SERIAL PRIMARY KEY,
+        submit_date DATE NOT NULL,
+        employer_first_letter CHAR(1) NOT NULL,
+        case_number VARCHAR(255),
+        request_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        estimated_completion_date DATE,
+        estimated_days INTEGER,
+        confidence_level DECIMAL(3,2),
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    # Prediction queue position and the monthly backlog: status counts over a
+    # (year, month number) range. monthly_status belongs to the loader, so the
+    # month number is an index expression rather than a column of its own
+    f"""
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_monthly_status_status_year_month_expr
+    ON monthly_status (status, year, ({MONTH_NUM_SQL}))
+    INCLUDE (count)
+    """,
+    # Company cases: exact match on the normalized employer name, newest first
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_perm_cases_emp_norm_submit
+    ON perm_cases (UPPER(TRIM(TRAILING '.' FROM employer_name)), submit_date DESC, case_number DESC)
+    """,
+    # Company search autocomplete: UPPER(employer_name) LIKE 'PREFIX%' over the
+    # searchable date range (text_pattern_ops so LIKE can use the btree)
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_perm_cases_emp_upper_prefix
+    ON perm_cases (UPPER(employer_name) text_pattern_ops)
+    WHERE submit_date >= '2024-03-01'
+    """,
+    # Updated cases: the ET calendar date of updated_at, skipping withdrawn cases
+    # like the endpoint does (updated_at is a UTC timestamp without time zone,
+    # so the expression is immutable)
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_perm_cases_updated_et_date
+    ON perm_cases (date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York'), submit_date DESC)
+    WHERE status <> 'WITHDRAWN'
+    """,
+    # Daily PERM activity and the processing times "as of" lookup: the same ET
+    # date expression, for all statuses (updated_at included so MAX(updated_at)
+    # on a date doesn't visit the heap)
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_perm_cases_et_date_status
+    ON perm_cases (date(updated_at AT TIME ZONE 'UTC' AT TIME ZONE 'America/New_York'), status)
+    INCLUDE (updated_at)
+    """,
+    # Today's progress and the latest record date: the summary row for a date,
+    # and the weekday comparison over a record_date range, from the index alone
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_summary_stats_record_date_cover
+    ON summary_stats (record_date)
+    INCLUDE (changes_today, completed_today, pending_applications)
+    """,
+    # Latest processing times (predictions and /processing-times): the newest
+    # record_date from the index, with the percentiles alongside
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_processing_times_record_date_cover
+    ON processing_times (record_date)
+    INCLUDE (percentile_30, percentile_50, percentile_80)
+    """,
+    # Daily volumes and weekday averages: a date range with every volume column
+    # the queries read, from the index alone. weekly_summary is a view over
+    # daily_progress, so its scans read this table too (views can't be indexed)
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_daily_progress_date_cover
+    ON daily_progress (date)
+    INCLUDE (total_applications, certified_total, processed_total)
+    """,
+    # PERM activity featured month: certified and review cases by submit_date
+    # range and employer letter, answerable from the index alone
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_perm_cases_submit_letter_status
+    ON perm_cases (submit_date, employer_first_letter, status)
+    WHERE status IN ('CERTIFIED', 'ANALYST REVIEW', 'RECONSIDERATION APPEALS')
+    """,
+]
+
+
+# Names of the indexes SCHEMA_STATEMENTS creates
+SCHEMA_INDEX_NAMES = [
+    match.group(1)
+    for match in (re.search(r"CREATE INDEX CONCURRENTLY IF NOT EXISTS (\w+)", statement) for statement in SCHEMA_STATEMENTS)
+    if match
+]
+
+
+def drop_invalid_indexes(cursor):
+    """
+    Drop any of our indexes left INVALID by an interrupted concurrent build.
+    
+    IF NOT EXISTS would otherwise skip them forever; once dropped, the
+    schema statements build them again.
+    """
+    cursor.execute("""
+        SELECT c.relname
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE NOT i.indisvalid
+        AND c.relname = ANY(%s)
+    """, (SCHEMA_INDEX_NAMES,))
+    
+    for (index_name,) in cursor.fetchall():
+        logger.warning("Rebuilding invalid index %s", index_name)
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+def ensure_schema():
+    """
+    Apply SCHEMA_STATEMENTS to the database.
+    
+    Each statement is idempotent and runs on its own (CREATE INDEX
+    CONCURRENTLY can't run inside a transaction block), so one failure
+    doesn't stop the rest. Indexes left INVALID by an interrupted build
+    are dropped first, so they are rebuilt.
+    """
+    try:
+        with postgres_connection() as conn:
+            with conn.cursor() as cursor:
+                # Index builds take far longer than API queries
+                cursor.execute("SET statement_timeout = 0")
+                
+                try:
+                    drop_invalid_indexes(cursor)
+                except Exception as e:
+                    logger.error("Error dropping invalid indexes: %s", e)
+                
+                for statement in SCHEMA_STATEMENTS:
+                    try:
+                        cursor.execute(statement)
+                    except Exception as e:
+                        logger.error("Error applying schema statement: %s", e)
+                
+                # Log the planner's row estimate as a startup sanity check
+                # (an exact COUNT(*) would scan the whole table)
+                cursor.execute("""
+                    SELECT reltuples::bigint
+                    FROM pg_class
+                    WHERE relname = 'perm_cases'
+                """)
+                estimate_row = cursor.fetchone()
+                if estimate_row:
+                    logger.info("PERM cases in database (estimate): %s", estimate_row[0])
+                
+                # Back to the connection's default before it returns to the pool
+                cursor.execute("RESET statement_timeout")
+        logger.info("Database schema is up to date")
+    except Exception as e:
+        logger.error("Error ensuring database schema: %s", e)
+
+
 class MockPostgresConnection:
     """Mock PostgreSQL connection for development and testing."""
     
-    def cursor(self, **kwargs):
-        return MockCursor()
+    def cursor(self, *args, **kwargs):
+        return MockCursor(self)
     
     def close(self):
         pass
@@ -78,6 +356,9 @@ class MockPostgresConnection:
 class MockCursor:
     """Mock cursor that returns sample data."""
     
+    def __init__(self, connection=None):
+        self.connection = connection
+    
     def __enter__(self):
         return self
     
@@ -94,6 +375,9 @@ class MockCursor:
     
     def fetchone(self):
         return None
+    
+    def __iter__(self):
+        return iter(self.fetchall())
 
 
 # Import database documentation
@@ -114,7 +398,7 @@ def init_db():
     Note: This application now uses PostgreSQL directly and no longer 
     requires SQLAlchemy model initialization.
     """
-    print("NOTE: init_db() is deprecated as we're using PostgreSQL directly.")
+    logger.warning("init_db() is deprecated as we're using PostgreSQL directly")
     pass
 
 
@@ -128,7 +412,7 @@ def get_db():
     Note: Any code using this function should be updated to use 
     get_postgres_connection() instead.
     """
-    print("WARNING: get_db() is deprecated. Use get_postgres_connection() instead.")
+    logger.warning("get_db() is deprecated. Use get_postgres_connection() instead")
     # Return a generator that yields a mock object
     class MockSession:
         def close(self):
@@ -82,8 +82,8 @@ Notes:
     - Status types include: ANALYST REVIEW, CERTIFIED, WITHDRAWN, DENIED, 
       SUPERVISED RECRUITMENT, RFI ISSUED, BALCA APPEALS, etc.
     - ANALYST REVIEW status represents cases waiting in the queue
-    - Month is stored as a text name rather than numeric value, requiring
-      special handling for chronological ordering
+    - Month is stored as a text name; order chronologically with a CASE
+      mapping month names to 1-12 (MONTH_NUM_SQL in models/database.py)
 
 Example Queries:
     # Get all ANALYST REVIEW cases by month/year, ordered chronologically
@@ -93,21 +93,7 @@ Example Queries:
         count 
     FROM monthly_status 
     WHERE status = 'ANALYST REVIEW'
-    ORDER BY year DESC, 
-        CASE
-            WHEN month = 'January' THEN 1
-            WHEN month = 'February' THEN 2
-            WHEN month = 'March' THEN 3
-            WHEN month = 'April' THEN 4
-            WHEN month = 'May' THEN 5
-            WHEN month = 'June' THEN 6
-            WHEN month = 'July' THEN 7
-            WHEN month = 'August' THEN 8
-            WHEN month = 'September' THEN 9
-            WHEN month = 'October' THEN 10
-            WHEN month = 'November' THEN 11
-            WHEN month = 'December' THEN 12
-        END DESC;
+    ORDER BY year DESC, CASE month WHEN 'January' THEN 1 ... WHEN 'December' THEN 12 END DESC;
 """
 
 PROCESSING_TIMES_DOCS = """
@@ -220,7 +220,8 @@ class CompanyCasesRequest(BaseModel):
     start_date: date = Field(..., description="Start date for case search (minimum: March 1st, 2024)")
     end_date: date = Field(..., description="End date for case search (maximum: October 31st, 2025, 2-week window)")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of cases to return")
-    offset: int = Field(0, ge=0, description="Offset for pagination")
+    offset: int = Field(0, ge=0, description="Offset for pagination (ignored when cursor is set)")
+    cursor: Optional[str] = Field(None, description="next_cursor from the previous page, for keyset pagination")
     recaptcha_token: str = Field(..., description="Google reCAPTCHA token")
 
 
@@ -236,9 +237,11 @@ class PermCaseData(BaseModel):
 
 class CompanyCasesResponse(BaseModel):
     cases: List[PermCaseData]
-    total: int
+    total: Optional[int] = None  # Only counted on the first page (no cursor)
+    total_capped: bool = False  # True when total stopped counting at the cap
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # Pass back as cursor to fetch the next page
     company_name: str
     date_range: Dict[str, str]  # start_date and end_date as ISO strings
 
@@ -247,7 +250,8 @@ class CompanyCasesResponse(BaseModel):
 class UpdatedCasesRequest(BaseModel):
     target_date: date = Field(..., description="Date to search for case updates (ET timezone). Must be between March 1st, 2024 and today.")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of cases to return")
-    offset: int = Field(0, ge=0, description="Offset for pagination")
+    offset: int = Field(0, ge=0, description="Offset for pagination (ignored when cursor is set)")
+    cursor: Optional[str] = Field(None, description="next_cursor from the previous page, for keyset pagination")
 
 
 class UpdatedPermCaseData(BaseModel):
@@ -264,9 +268,11 @@ class UpdatedPermCaseData(BaseModel):
 
 class UpdatedCasesResponse(BaseModel):
     cases: List[UpdatedPermCaseData]
-    total: int
+    total: Optional[int] = None  # Only counted on the first page (no cursor)
+    total_capped: bool = False  # True when total stopped counting at the cap
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # Pass back as cursor to fetch the next page
     target_date: str  # ISO format date string
     timezone_note: str  # Note about timezone conversion
 
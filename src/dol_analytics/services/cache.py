@@ -0,0 +1,105 @@
+"""
+In-process caching for expensive API responses.
+
+The API runs as a single uvicorn worker, so a per-process cache is shared
+by every request and needs no external store.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger("dol_analytics.cache")
+
+
+class TTLCache:
+    """
+    Bounded TTL cache with per-key locking and stale-while-revalidate.
+
+    - Entries younger than ``ttl`` are served as-is.
+    - Entries up to ``stale_ttl`` seconds past expiry are served immediately
+      while a single background task rebuilds them.
+    - Misses are computed under a per-key asyncio.Lock, so concurrent
+      requests for the same key run the loader once instead of stampeding.
+      Locks are only held weakly, so a key's lock goes away once no request
+      is waiting on it (keys that include the date would otherwise pile up).
+    - The least recently used entry is evicted beyond ``maxsize`` entries.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 64, stale_ttl: float = 0):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        # Structure: {key: (time.monotonic() when stored, value)}
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._locks: "weakref.WeakValueDictionary[Hashable, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self._refresh_tasks: Dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the fresh value for a key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entries if full."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry."""
+        self._entries.clear()
+
+    async def get_or_set(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for a key, calling ``loader`` to build it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function with no arguments that builds the value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            built_at, value = entry
+            age = time.monotonic() - built_at
+            if age < self.ttl:
+                self._entries.move_to_end(key)
+                return value
+            if age < self.ttl + self.stale_ttl:
+                self._schedule_refresh(key, loader)
+                return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have filled the entry while we waited
+            value = self.get(key)
+            if value is not None:
+                return value
+            value = await loader()
+            self.set(key, value)
+            return value
+
+    def _schedule_refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        """Start a background rebuild of a stale entry unless one is already running."""
+        if key in self._refresh_tasks:
+            return
+        self._refresh_tasks[key] = asyncio.create_task(self._refresh(key, loader))
+
+    async def _refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        try:
+            async with self._locks.setdefault(key, asyncio.Lock()):
+                self.set(key, await loader())
+        except Exception as e:
+            logger.error(f"Error refreshing cache entry {key!r}: {str(e)}")
+        finally:
+            self._refresh_tasks.pop(key, None)
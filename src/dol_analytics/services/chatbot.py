@@ -6,16 +6,20 @@ from typing import Dict, Any, Optional, List
 from openai import OpenAI
 
 
-# Use relative imports if running as a module
-try:
-    from ..config import get_settings
-except ImportError:
-    # Use absolute imports if running as a script
-    from src.dol_analytics.config import get_settings
+from ..config import get_settings
+from ..models.database import execute_prepared, MONTH_NUM_SQL
+
+settings = get_settings()
 
 # Set up logger
 logger = logging.getLogger("dol_analytics.chatbot")
 
+# Month names by month number - 1, as monthly_status stores them
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
 
 class PermChatbot:
     """
@@ -25,13 +29,10 @@ class PermChatbot:
     def __init__(self, db_connection):
         self.conn = db_connection
         
-        # Get settings using the project's config pattern
-        self.settings = get_settings()
-        
         # Set up OpenAI client
         self.openai_client = None
-        if self.settings.OPENAI_API_KEY:
-            self.openai_client = OpenAI(api_key=self.settings.OPENAI_API_KEY)
+        if settings.OPENAI_API_KEY:
+            self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
         else:
             logger.warning("No OpenAI API key found. Set OPENAI_API_KEY in .env file.")
     
@@ -226,7 +227,7 @@ If parameters aren't found or intent doesn't require them, leave parameters empt
         try:
             with self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
                 # Find the earliest 2024 month with backlog > 3000 (active processing threshold)
-                cursor.execute("""
+                cursor.execute(f"""
                     SELECT 
                         month,
                         year,
@@ -235,21 +236,7 @@ If parameters aren't found or intent doesn't require them, leave parameters empt
                     WHERE status = 'ANALYST REVIEW' 
                         AND year = 2024
                         AND count > 3000
-                    ORDER BY 
-                        CASE
-                            WHEN month = 'January' THEN 1
-                            WHEN month = 'February' THEN 2
-                            WHEN month = 'March' THEN 3
-                            WHEN month = 'April' THEN 4
-                            WHEN month = 'May' THEN 5
-                            WHEN month = 'June' THEN 6
-                            WHEN month = 'July' THEN 7
-                            WHEN month = 'August' THEN 8
-                            WHEN month = 'September' THEN 9
-                            WHEN month = 'October' THEN 10
-                            WHEN month = 'November' THEN 11
-                            WHEN month = 'December' THEN 12
-                        END ASC
+                    ORDER BY {MONTH_NUM_SQL} ASC
                     LIMIT 1
                 """)
                 
@@ -272,11 +259,12 @@ If parameters aren't found or intent doesn't require them, leave parameters empt
         """
         try:
             with self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor) as cursor:
-                cursor.execute("""
+                # Runs once per month to clear in get_intermediate_backlogs, so prepared
+                execute_prepared(cursor, "chatbot_month_backlog", """
                     SELECT count 
                     FROM monthly_status 
-                    WHERE month = %s 
-                        AND year = %s 
+                    WHERE month = $1 
+                        AND year = $2 
                         AND status = 'ANALYST REVIEW'
                 """, (month, year))
                 
@@ -332,11 +320,8 @@ If parameters aren't found or intent doesn't require them, leave parameters empt
         Get backlogs for all months that need to be cleared before target month starts.
         For June to start, we need to clear April + May (not June itself).
         """
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June', 
-                      'July', 'August', 'September', 'October', 'November', 'December']
-        
-        current_idx = month_order.index(current_month)
-        target_idx = month_order.index(target_month)
+        current_idx = MONTH_NAMES.index(current_month)
+        target_idx = MONTH_NAMES.index(target_month)
         
         # Get all months between current and target (exclusive of target)
         months_to_clear = []
@@ -344,13 +329,13 @@ If parameters aren't found or intent doesn't require them, leave parameters empt
         if target_year == current_year:
             # Same year: get months from current+1 to target-1 (exclude current, it's already counted)
             for i in range(current_idx + 1, target_idx):
-                months_to_clear.append((month_order[i], current_year))
+                months_to_clear.append((MONTH_NAMES[i], current_year))
         else:
             # Different year: current+1 to December, then January to target-1
             for i in range(current_idx + 1, 12):
-                months_to_clear.append((month_order[i], current_year))
+                months_to_clear.append((MONTH_NAMES[i], current_year))
             for i in range(0, target_idx):
-                months_to_clear.append((month_order[i], target_year))
+                months_to_clear.append((MONTH_NAMES[i], target_year))
         
         # Get backlogs for these months
         backlogs = []
@@ -365,13 +350,10 @@ If parameters aren't found or intent doesn't require them, leave parameters empt
     
     def get_month_names_between(self, current_month: str, target_month: str) -> List[str]:
         """Get month names between current and target (exclusive of both)."""
-        month_order = ['January', 'February', 'March', 'April', 'May', 'June', 
-                      'July', 'August', 'September', 'October', 'November', 'December']
+        current_idx = MONTH_NAMES.index(current_month)
+        target_idx = MONTH_NAMES.index(target_month)
         
-        current_idx = month_order.index(current_month)
-        target_idx = month_order.index(target_month)
-        
-        return [month_order[i] for i in range(current_idx + 1, target_idx)]
+        return [MONTH_NAMES[i] for i in range(current_idx + 1, target_idx)]
     
     def format_timeline(self, weeks_needed: float, estimated_date: 'date') -> str:
         """
@@ -399,7 +381,7 @@ If parameters aren't found or intent doesn't require them, leave parameters empt
         
         # For longer timelines, use relative month descriptions
         today = date.today()
-        target_month = estimated_date.strftime('%B')
+        target_month = MONTH_NAMES[estimated_date.month - 1]
         target_year = estimated_date.year
         
         # Check if it's early, mid, or late in the month
@@ -461,13 +443,9 @@ If parameters aren't found or intent doesn't require them, leave parameters empt
             # Need to clear current month backlog AND target month backlog down to ~3k threshold
             target_threshold = 3000
             
-            # If we're predicting the next month after current active month
-            month_order = ['January', 'February', 'March', 'April', 'May', 'June', 
-                          'July', 'August', 'September', 'October', 'November', 'December']
-            
-            current_month_idx = month_order.index(most_active_month["month"])
+            current_month_idx = MONTH_NAMES.index(most_active_month["month"])
             try:
-                target_month_idx = month_order.index(target_month)
+                target_month_idx = MONTH_NAMES.index(target_month)
             except ValueError:
                 return {
                     "message": f"Invalid month name: {target_month}",
@@ -6,22 +6,12 @@ from sqlalchemy import func, and_, desc
 import pandas as pd
 import numpy as np
 
-# Use relative imports if running as a module
-try:
-    from ..models.database import CaseData, DailyMetrics, PredictionModel
-    from ..services.dol_api import DOLAPIClient
-    from ..models.schemas import (
-        CaseCreate, CaseUpdate, DailyMetricsCreate, PredictionModelCreate,
-        DailyVolumeData, WeeklyAverageData, WeeklyVolumeData, MonthlyVolumeData
-    )
-except ImportError:
-    # Use absolute imports if running as a script
-    from src.dol_analytics.models.database import CaseData, DailyMetrics, PredictionModel
-    from src.dol_analytics.services.dol_api import DOLAPIClient
-    from src.dol_analytics.models.schemas import (
-        CaseCreate, CaseUpdate, DailyMetricsCreate, PredictionModelCreate,
-        DailyVolumeData, WeeklyAverageData, WeeklyVolumeData, MonthlyVolumeData
-    )
+from ..models.database import CaseData, DailyMetrics, PredictionModel
+from ..services.dol_api import DOLAPIClient
+from ..models.schemas import (
+    CaseCreate, CaseUpdate, DailyMetricsCreate, PredictionModelCreate,
+    DailyVolumeData, WeeklyAverageData, WeeklyVolumeData, MonthlyVolumeData
+)
 
 
 class DataProcessor:
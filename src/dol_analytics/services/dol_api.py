@@ -4,12 +4,7 @@ from typing import Dict, List, Any, Optional, Union
 import httpx
 from fastapi import HTTPException
 
-# Use relative imports if running as a module
-try:
-    from ..config import get_settings
-except ImportError:
-    # Use absolute imports if running as a script
-    from src.dol_analytics.config import get_settings
+from ..config import get_settings
 
 settings = get_settings()
 
@@ -4,16 +4,9 @@ from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
-# Use relative imports if running as a module
-try:
-    from ..models.database import CaseData, DailyMetrics, PredictionModel
-    from ..services.dol_api import DOLAPIClient
-    from ..models.schemas import CasePrediction
-except ImportError:
-    # Use absolute imports if running as a script
-    from src.dol_analytics.models.database import CaseData, DailyMetrics, PredictionModel
-    from src.dol_analytics.services.dol_api import DOLAPIClient
-    from src.dol_analytics.models.schemas import CasePrediction
+from ..models.database import CaseData, DailyMetrics, PredictionModel
+from ..services.dol_api import DOLAPIClient
+from ..models.schemas import CasePrediction
 
 
 class PredictionService:
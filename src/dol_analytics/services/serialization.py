@@ -0,0 +1,40 @@
+"""
+Fast JSON serialization for API responses, backed by orjson.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _json_default(value):
+    # Postgres SUM()/AVG() come back as Decimal; encode them the way FastAPI's
+    # jsonable_encoder does (int without a fractional part, float otherwise)
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    # Query helpers return their rows as Pydantic models
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def encode_json(value: Any) -> bytes:
+    """Serialize a payload to JSON bytes, with dates and datetimes as ISO strings."""
+    return orjson.dumps(value, default=_json_default)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+    
+    Only a win when the route returns an ORJSONResponse itself: FastAPI runs
+    jsonable_encoder over any other return value before render is called.
+    Routes with a response_model are faster on FastAPI's default response
+    class, which serializes through Pydantic directly.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
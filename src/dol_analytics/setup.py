@@ -1,8 +0,0 @@
-from setuptools import setup, find_packages
-
-setup(
-    name="dol-analytics",
-    version="0.1.0",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-)
\ No newline at end of file
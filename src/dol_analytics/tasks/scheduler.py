@@ -5,16 +5,9 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
 
-# Use relative imports if running as a module
-try:
-    from ..models.database import get_db, init_db
-    from ..services.data_processor import DataProcessor
-    from ..config import get_settings
-except ImportError:
-    # Use absolute imports if running as a script
-    from src.dol_analytics.models.database import get_db, init_db
-    from src.dol_analytics.services.data_processor import DataProcessor
-    from src.dol_analytics.config import get_settings
+from ..models.database import get_db, init_db
+from ..services.data_processor import DataProcessor
+from ..config import get_settings
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -0,0 +1,63 @@
+"""Tests for the in-process cache."""
+import asyncio
+
+from src.dol_analytics.services.cache import TTLCache
+
+
+def test_get_or_set_runs_loader_once_for_concurrent_misses():
+    """Test that concurrent misses for one key share a single load."""
+    cache = TTLCache(ttl=60)
+    calls = []
+    
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+    
+    async def run():
+        return await asyncio.gather(*(cache.get_or_set("key", loader) for _ in range(5)))
+    
+    results = asyncio.run(run())
+    assert results == [{"value": 1}] * 5
+    assert len(calls) == 1
+
+
+def test_get_or_set_drops_lock_after_load():
+    """Test that per-key locks don't outlive the loads that use them."""
+    cache = TTLCache(ttl=60)
+    
+    async def loader():
+        return "value"
+    
+    asyncio.run(cache.get_or_set("key", loader))
+    assert len(cache._locks) == 0
+
+
+def test_stale_entry_is_served_while_refreshing():
+    """Test that an expired entry within stale_ttl is returned and rebuilt in the background."""
+    cache = TTLCache(ttl=0, stale_ttl=60)
+    cache.set("key", "old")
+    
+    async def loader():
+        return "new"
+    
+    async def run():
+        first = await cache.get_or_set("key", loader)
+        await asyncio.sleep(0)  # let the refresh task run
+        return first
+    
+    assert asyncio.run(run()) == "old"
+    assert cache._entries["key"][1] == "new"
+
+
+def test_set_evicts_least_recently_used():
+    """Test that the cache keeps at most maxsize entries."""
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert len(cache) == 2
+
@@ -0,0 +1,81 @@
+"""Tests for data route helpers."""
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from src.dol_analytics.api.routes.data import (
+    encode_case_cursor, decode_case_cursor, summarize_weekly_averages, get_company_cases_page,
+    dashboard_etag, etag_matches
+)
+
+
+def test_case_cursor_round_trip():
+    """Test that a pagination cursor decodes back to the sort key it encodes."""
+    cursor = encode_case_cursor(date(2024, 5, 1), "G-100-24123-456789")
+    assert decode_case_cursor(cursor) == (date(2024, 5, 1), "G-100-24123-456789")
+
+
+def test_decode_case_cursor_rejects_garbage():
+    """Test that a malformed cursor raises ValueError."""
+    with pytest.raises(ValueError):
+        decode_case_cursor("not-a-cursor")
+
+
+def test_dashboard_etag_follows_payload():
+    """Test that the dashboard ETag is a weak quoted tag that changes with the payload."""
+    etag = dashboard_etag(b'{"days": 30}')
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert dashboard_etag(b'{"days": 30}') == etag
+    assert dashboard_etag(b'{"days": 7}') != etag
+
+
+def test_etag_matches_lists_and_weak_tags():
+    """Test that If-None-Match lists and weak tags match the dashboard ETag."""
+    etag = dashboard_etag(b'{"days": 30}')
+    strong = etag[2:]
+    assert etag_matches(etag, etag)
+    assert etag_matches(strong, etag)
+    assert etag_matches(f'"other", {strong}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_summarize_weekly_averages_orders_monday_first():
+    """Test that weekday averages are computed from daily rows, Monday first."""
+    rows = [(date(2024, 5, 5), 10), (date(2024, 5, 6), 4), (date(2024, 5, 13), 8)]  # Sun, Mon, Mon
+    assert summarize_weekly_averages(rows) == [("Monday", 6.0), ("Sunday", 10.0)]
+
+
+def test_company_cases_short_page_skips_count_query():
+    """Test that a first page shorter than the limit reports its total without counting."""
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [
+        ("G-100-24123-000002", "Engineer", date(2024, 5, 2), "ACME INC", "A", "CERTIFIED"),
+        ("G-100-24123-000001", "Engineer", date(2024, 5, 1), "ACME INC", "A", "CERTIFIED"),
+    ]
+    
+    total, capped, cases, next_cursor = get_company_cases_page(
+        conn, "Acme Inc", date(2024, 3, 1), date(2024, 6, 1), limit=10, offset=0
+    )
+    
+    assert (total, capped, next_cursor) == (2, False, None)
+    assert cases[0]["submit_date"] == date(2024, 5, 2)
+    assert not any("company_cases_count" in call.args[0] for call in cursor.execute.call_args_list)
+
+
+def test_company_cases_keyset_coalesces_case_number():
+    """Test that the company cases keyset compares the same COALESCEd case number it sorts by."""
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = []
+    
+    get_company_cases_page(
+        conn, "Acme Inc", date(2024, 3, 1), date(2024, 6, 1), limit=10, offset=0,
+        after=(date(2024, 5, 1), "")
+    )
+    
+    prepare = cursor.execute.call_args_list[0].args[0]
+    assert "COALESCE(case_number, '') as case_number" in prepare
+    assert "(submit_date, COALESCE(case_number, '')) <" in prepare
@@ -33,4 +33,56 @@ def test_mock_cursor_methods():
     # Test methods
     cursor.execute("SELECT 1")
     assert cursor.fetchall() == []
-    assert cursor.fetchone() is None 
\ No newline at end of file
+    assert cursor.fetchone() is None
+    assert list(cursor) == [] 
+
+def test_execute_prepared_prepares_once_per_connection():
+    """Test that execute_prepared only PREPAREs a statement once per connection."""
+    from unittest.mock import Mock
+    from src.dol_analytics.models.database import execute_prepared
+    
+    cursor = Mock()
+    cursor.connection = Mock()
+    
+    execute_prepared(cursor, "test_stmt", "SELECT $1", (1,))
+    execute_prepared(cursor, "test_stmt", "SELECT $1", (2,))
+    
+    statements = [call.args[0] for call in cursor.execute.call_args_list]
+    assert statements == [
+        "PREPARE test_stmt AS SELECT $1",
+        "EXECUTE test_stmt (%s)",
+        "EXECUTE test_stmt (%s)",
+    ]
+
+
+def test_drop_invalid_indexes_drops_only_reported_indexes():
+    """Test that indexes left INVALID by an interrupted build are dropped for rebuilding."""
+    from unittest.mock import Mock
+    from src.dol_analytics.models.database import drop_invalid_indexes, SCHEMA_INDEX_NAMES
+    
+    cursor = Mock()
+    cursor.fetchall.return_value = [("idx_perm_cases_emp_norm_submit",)]
+    
+    drop_invalid_indexes(cursor)
+    
+    assert cursor.execute.call_args_list[0].args[1] == (SCHEMA_INDEX_NAMES,)
+    assert cursor.execute.call_args_list[1].args[0] == (
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_perm_cases_emp_norm_submit"
+    )
+    assert "idx_perm_cases_emp_norm_submit" in SCHEMA_INDEX_NAMES
+
+
+def test_checkout_connection_replaces_dead_connection():
+    """Test that a pooled connection failing its ping is closed and replaced once."""
+    from unittest.mock import MagicMock
+    import psycopg2
+    from src.dol_analytics.models.database import checkout_connection
+    
+    dead, fresh = MagicMock(), MagicMock()
+    dead.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.OperationalError("server closed")
+    pool = MagicMock()
+    pool.getconn.side_effect = [dead, fresh]
+    
+    assert checkout_connection(pool) is fresh
+    pool.putconn.assert_called_once_with(dead, close=True)
+    assert fresh.autocommit is True
@@ -1,10 +1,14 @@
+import asyncio
 import pytest
+from contextlib import contextmanager
 from datetime import date
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 from fastapi.testclient import TestClient
 from fastapi import Depends
 from src.dol_analytics.main import app
-from src.dol_analytics.api.routes.predictions import router
+from src.dol_analytics.api.routes.predictions import (
+    router, prediction_baseline_cache, prediction_count_cache
+)
 
 # Create a mock database connection for testing
 def get_mock_postgres_connection():
@@ -31,6 +35,8 @@ class TestPredictionEndpoints:
         app.dependency_overrides = {}
         from src.dol_analytics.models.database import get_postgres_connection
         app.dependency_overrides[get_postgres_connection] = get_mock_postgres_connection
+        prediction_baseline_cache.clear()
+        prediction_count_cache.clear()
         self.client = TestClient(app)
     
     def teardown_method(self):
@@ -49,12 +55,15 @@ class TestPredictionEndpoints:
             
             # Mock database responses in order
             mock_cursor.fetchone.side_effect = [
-                {'id': 1},  # INSERT RETURNING id
-                {'median_days': 150, 'upper_estimate_days': 300},  # processing_times
-                {'pending_applications': 50000},  # summary_stats
-                {'avg_weekly_apps': 2900},  # weekly_summary
-                {'cases_ahead': 10000},  # monthly_status before month
-                {'count': 5000},  # monthly_status same month
+                {
+                    'processing_found': True,
+                    'median_days': 150,  # processing_times
+                    'upper_estimate_days': 300,
+                    'pending_applications': 50000,  # summary_stats
+                    'avg_weekly_apps': 2900,  # weekly_summary
+                },
+                (10000, 5000),  # monthly_status before month, same month
+                (1,),  # INSERT RETURNING id
             ]
             
             mock_connection.cursor.return_value = mock_cursor
@@ -85,8 +94,39 @@ class TestPredictionEndpoints:
         assert "estimated_completion_date" in data
         assert "estimated_days" in data
     
+    def test_predict_from_date_reuses_baseline_inputs(self):
+        """Test that repeated /from-date requests read the baseline inputs once."""
+        mock_cursor = Mock()
+        mock_cursor.__enter__ = Mock(return_value=mock_cursor)
+        mock_cursor.__exit__ = Mock(return_value=None)
+        baseline_row = {
+            'processing_found': True,
+            'median_days': 150,
+            'upper_estimate_days': 300,
+            'pending_applications': 50000,
+            'avg_weekly_apps': 2900,
+        }
+        mock_cursor.fetchone.side_effect = [baseline_row, (10000, 5000), (1,), (10000, 5000), (2,)]
+        
+        def get_test_postgres_connection():
+            mock_connection = Mock()
+            mock_connection.cursor.return_value = mock_cursor
+            yield mock_connection
+        
+        from src.dol_analytics.models.database import get_postgres_connection
+        app.dependency_overrides[get_postgres_connection] = get_test_postgres_connection
+        
+        test_data = {"submit_date": "2024-01-15", "employer_first_letter": "B"}
+        for _ in range(2):
+            response = self.client.post("/api/predictions/from-date", json=test_data)
+            assert response.status_code == 200
+        
+        # One baseline read, then a queue position read and an INSERT per request
+        queries = [call.args[0] for call in mock_cursor.execute.call_args_list]
+        assert sum("FROM processing_times" in query for query in queries) == 1
+        assert sum(query.startswith("EXECUTE prediction_insert") for query in queries) == 2
 
-    def test_get_prediction_requests(self):
+    def test_get_prediction_requests(self, monkeypatch):
         """Test the GET /api/predictions/requests endpoint."""
         # Override the database dependency with specific mock responses
         def get_test_postgres_connection():
@@ -125,8 +165,11 @@ class TestPredictionEndpoints:
             mock_connection.cursor.return_value = mock_cursor
             yield mock_connection
         
+        from src.dol_analytics.models import database
         from src.dol_analytics.models.database import get_postgres_connection
         app.dependency_overrides[get_postgres_connection] = get_test_postgres_connection
+        # The cached count is read on its own connection
+        monkeypatch.setattr(database, "postgres_connection", contextmanager(get_test_postgres_connection))
         
         # Make request
         response = self.client.get("/api/predictions/requests")
@@ -135,13 +178,22 @@ class TestPredictionEndpoints:
         assert response.status_code == 200
         data = response.json()
         
-        assert "total" in data
+        assert "estimated_total" in data
         assert "requests" in data
+        assert data["estimated_total"] == 2
         assert data["total"] == 2
+        assert data["offset"] == 0
+        assert data["next_after_id"] is None
         assert len(data["requests"]) == 2
         assert data["requests"][0]["case_number"] == "CASE123456"
         assert data["requests"][1]["case_number"] == "CASE789012"
     
+    def test_get_prediction_requests_rejects_empty_page(self):
+        """Test that /api/predictions/requests rejects a limit below 1."""
+        response = self.client.get("/api/predictions/requests?limit=0")
+        
+        assert response.status_code == 422
+    
     def test_get_prediction_request_by_id(self):
         """Test the GET /api/predictions/requests/{id} endpoint."""
         # Override the database dependency with specific mock responses
@@ -205,4 +257,39 @@ class TestPredictionEndpoints:
         
         # Assertions
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower() 
\ No newline at end of file
+        assert "not found" in response.json()["detail"].lower() 
+
+def test_verify_recaptcha_reuses_verified_token(monkeypatch):
+    """Test that a token Google accepted is not sent for verification again."""
+    from src.dol_analytics.api.routes import predictions
+    
+    monkeypatch.setattr(predictions.settings, "RECAPTCHA_SECRET_KEY", "secret")
+    monkeypatch.setattr(predictions.settings, "DEBUG", False)
+    mock_post = AsyncMock(return_value=Mock(json=Mock(return_value={"success": True})))
+    monkeypatch.setattr(predictions, "get_http_client", lambda: Mock(post=mock_post))
+    predictions.verified_recaptcha_tokens.clear()
+    
+    assert asyncio.run(predictions.verify_recaptcha("token-1", "203.0.113.7")) is True
+    assert asyncio.run(predictions.verify_recaptcha("token-1", "203.0.113.7")) is True
+    assert mock_post.await_count == 1
+
+
+def test_verify_recaptcha_limits_token_reuse(monkeypatch):
+    """Test that a verified token is only reused by the same client, a few times."""
+    from src.dol_analytics.api.routes import predictions
+    
+    monkeypatch.setattr(predictions.settings, "RECAPTCHA_SECRET_KEY", "secret")
+    monkeypatch.setattr(predictions.settings, "DEBUG", False)
+    # Google rejects a token it has already seen
+    mock_post = AsyncMock(side_effect=[
+        Mock(json=Mock(return_value={"success": True})),
+        Mock(json=Mock(return_value={"success": False})),
+    ])
+    monkeypatch.setattr(predictions, "get_http_client", lambda: Mock(post=mock_post))
+    predictions.verified_recaptcha_tokens.clear()
+    
+    for _ in range(predictions.RECAPTCHA_TOKEN_MAX_USES):
+        assert asyncio.run(predictions.verify_recaptcha("token-1", "203.0.113.7")) is True
+    assert asyncio.run(predictions.verify_recaptcha("token-1", "203.0.113.7")) is False
+    assert asyncio.run(predictions.verify_recaptcha("token-1", "198.51.100.2")) is False
+    assert mock_post.await_count == 2
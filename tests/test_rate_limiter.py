@@ -0,0 +1,83 @@
+"""Tests for the sliding window rate limiter."""
+import importlib
+from unittest.mock import Mock
+
+from src.dol_analytics.middleware.rate_limiter import RateLimiter
+
+# The package re-exports the limiter instance under the module's name
+rate_limiter_module = importlib.import_module("src.dol_analytics.middleware.rate_limiter")
+
+
+def make_request(path="/api/data/company-cases", ip="203.0.113.7"):
+    """Build a minimal request object for the limiter."""
+    return Mock(url=Mock(path=path), headers={"X-Forwarded-For": ip}, client=None)
+
+
+def test_rate_limit_blocks_after_limit_and_sets_retry_after(monkeypatch):
+    """Test that requests beyond the endpoint limit are rejected with a retry hint."""
+    limiter = RateLimiter()
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: 1000.0)
+
+    for _ in range(5):
+        assert limiter.is_rate_limited(make_request()) is None
+
+    result = limiter.is_rate_limited(make_request())
+    assert result is not None
+    assert result["current_requests"] == 5
+    assert 1 <= result["retry_after"] <= 120
+
+
+def test_rate_limit_weights_previous_window(monkeypatch):
+    """Test that the previous window's requests count in proportion to their overlap."""
+    limiter = RateLimiter()
+    now = [1250.0]
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: now[0])
+
+    for _ in range(5):
+        assert limiter.is_rate_limited(make_request()) is None
+
+    # A quarter into the next window, 5 * 0.75 earlier requests still count
+    now[0] = 1275.0
+    assert limiter.is_rate_limited(make_request()) is None
+    assert limiter.is_rate_limited(make_request()) is None
+    assert limiter.is_rate_limited(make_request())["current_requests"] == 5
+
+    # As the previous window decays, requests are allowed again
+    now[0] = 1305.0
+    assert limiter.is_rate_limited(make_request()) is None
+
+
+def test_unlimited_endpoint_is_not_tracked():
+    """Test that endpoints without a configured limit are not tracked."""
+    limiter = RateLimiter()
+
+    assert limiter.is_rate_limited(make_request(path="/api/data/perm-cases")) is None
+    assert len(limiter.requests) == 0
+
+
+def test_least_recently_seen_ip_is_forgotten():
+    """Test that the limiter tracks at most max_tracked_ips IPs."""
+    limiter = RateLimiter(max_tracked_ips=2)
+
+    limiter.is_rate_limited(make_request(ip="203.0.113.1"))
+    limiter.is_rate_limited(make_request(ip="203.0.113.2"))
+    limiter.is_rate_limited(make_request(ip="203.0.113.1"))
+    limiter.is_rate_limited(make_request(ip="203.0.113.3"))
+
+    assert list(limiter.requests) == ["203.0.113.1", "203.0.113.3"]
+
+
+def test_suspicious_ips_restart_after_an_hour(monkeypatch):
+    """Test that violations older than an hour stop counting toward suspicious activity."""
+    limiter = RateLimiter()
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter_module.time, "time", lambda: now[0])
+
+    limiter.track_suspicious_activity("203.0.113.7", "/api/data/company-cases", 5, 5)
+    limiter.track_suspicious_activity("203.0.113.7", "/api/data/company-cases", 5, 5)
+    assert limiter.suspicious_ips["203.0.113.7"]["count"] == 2
+
+    now[0] += 3600
+    limiter.track_suspicious_activity("203.0.113.7", "/api/data/company-search", 10, 10)
+    assert limiter.suspicious_ips["203.0.113.7"]["count"] == 1
+    assert limiter.suspicious_ips["203.0.113.7"]["endpoints"] == {"/api/data/company-search": 1}
@@ -0,0 +1,29 @@
+"""Tests for JSON serialization helpers."""
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from src.dol_analytics.services.serialization import encode_json, ORJSONResponse
+
+
+def test_encode_json_handles_decimals():
+    """Test that Decimal values from Postgres aggregates encode as JSON numbers."""
+    assert encode_json({"a": Decimal("12"), "b": Decimal("1.5")}) == b'{"a":12,"b":1.5}'
+
+
+def test_orjson_response_renders_dates_as_iso_strings():
+    """Test that ORJSONResponse encodes dates like jsonable_encoder does."""
+    response = ORJSONResponse({"date": date(2024, 5, 1)})
+    assert response.body == b'{"date":"2024-05-01"}'
+
+
+def test_encode_json_dumps_pydantic_models():
+    """Test that query helper models encode without going through jsonable_encoder."""
+    class Point(BaseModel):
+        date: date
+        volume: int
+    
+    assert encode_json({"data": [Point(date=date(2024, 5, 1), volume=3)]}) == (
+        b'{"data":[{"date":"2024-05-01","volume":3}]}'
+    )